@@ -3,38 +3,187 @@ Django Admin configuration for ETL Framework models
 Provides comprehensive admin interface for migration monitoring
 """
 
+import csv
+import html
+
 from django.contrib import admin
-from django.utils.html import format_html
+from django.contrib.admin import helpers
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.http import StreamingHttpResponse
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.safestring import mark_safe
-from django.db.models import Count, Q
+from django.db import connections
+from django.db.models import (
+    Case,
+    Count,
+    DurationField,
+    ExpressionWrapper,
+    F,
+    FloatField,
+    Q,
+    Value,
+    When,
+)
 from django.utils import timezone
 from datetime import timedelta
-import json
 
-from .models import MigrationLog, MigrationRunSummary
+from . import jsonutils
+from .models import MigrationLog, MigrationRunSummary, format_duration
+from .settings import get_etl_setting
+from .signals import (
+    DASHBOARD_STATS_CACHE_KEY,
+    SUMMARY_STATS_CACHE_KEY,
+    TRANSFORMER_NAMES_CACHE_KEY,
+    USER_NAMES_CACHE_KEY,
+)
+
+# Cache lifetimes for admin statistics (entries are also dropped on writes)
+SUMMARY_STATS_CACHE_TIMEOUT = 60
+DASHBOARD_STATS_CACHE_TIMEOUT = 30
+LIST_FILTER_CACHE_TIMEOUT = 60
+
+# Columns written by the CSV export action (JSON payloads are left out)
+EXPORT_FIELDS = [
+    "id",
+    "transformer",
+    "run_at",
+    "duration_seconds",
+    "success",
+    "dry_run",
+    "batch_size",
+    "total_records",
+    "error_message",
+]
+EXPORT_CHUNK_SIZE = 2000
+
+# Tables smaller than this are always counted exactly
+ESTIMATED_COUNT_THRESHOLD = 100000
+
+# Static status markup, shared by every changelist row
+SUCCESS_LABEL = mark_safe('<span style="color: green;">✅ Success</span>')
+FAILED_LABEL = mark_safe('<span style="color: red;">❌ Failed</span>')
+IN_PROGRESS_LABEL = mark_safe('<span style="color: orange;">🔄 In Progress</span>')
+COMPLETED_LABEL = mark_safe('<span style="color: green;">✅ Completed</span>')
+DRY_RUN_BADGE = mark_safe(
+    '<span style="background: #ffc107; color: black; padding: 2px 6px; border-radius: 3px; font-size: 11px;">DRY RUN</span>'
+)
+LIVE_BADGE = mark_safe(
+    '<span style="background: #28a745; color: white; padding: 2px 6px; border-radius: 3px; font-size: 11px;">LIVE</span>'
+)
+
+
+def estimated_count(model, using="default"):
+    """
+    Get the database's row estimate for a model's table
 
+    Args:
+        model: Django model class
+        using: Database alias to query
 
-class TransformerListFilter(admin.SimpleListFilter):
-    """Custom filter for transformer names"""
+    Returns:
+        Estimated row count, or None if the backend has no cheap estimate
+    """
+    connection = connections[using]
+    table_name = model._meta.db_table
+
+    if connection.vendor == "postgresql":
+        sql = "SELECT reltuples::bigint FROM pg_class WHERE relname = %s"
+    elif connection.vendor == "mysql":
+        sql = (
+            "SELECT table_rows FROM information_schema.TABLES "
+            "WHERE table_schema = DATABASE() AND table_name = %s"
+        )
+    else:
+        return None
 
-    title = "transformer"
-    parameter_name = "transformer"
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table_name])
+        row = cursor.fetchone()
+
+    # reltuples is -1 for tables that have never been analyzed
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def preformatted(text):
+    """Wrap text in a <pre> block, escaping it in a single pass"""
+    return mark_safe(f"<pre>{html.escape(text, quote=False)}</pre>")
+
+
+class EchoBuffer:
+    """File-like object that hands written rows back to the CSV writer's caller"""
+
+    def write(self, value):
+        return value
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses the planner's row estimate for unfiltered querysets
+    on large tables instead of a full SELECT COUNT(*)
+    """
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, "query", None)
+        if query is not None and not query.where:
+            estimate = estimated_count(self.object_list.model, self.object_list.db)
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+class CachedDistinctValuesListFilter(admin.SimpleListFilter):
+    """
+    Filter over the distinct values of a column. The values are cached
+    briefly so the DISTINCT query doesn't run on every changelist load.
+    """
+
+    model = None
+    field_name = None
+    cache_key = None
 
     def lookups(self, request, model_admin):
-        transformers = MigrationLog.objects.values_list(
-            "transformer", flat=True
-        ).distinct()
-        return [
-            (transformer, transformer) for transformer in transformers if transformer
-        ]
+        values = cache.get(self.cache_key)
+        if values is None:
+            # Clear the default ordering so DISTINCT doesn't force a sort
+            values = list(
+                self.model.objects.order_by()
+                .values_list(self.field_name, flat=True)
+                .distinct()
+            )
+            cache.set(self.cache_key, values, LIST_FILTER_CACHE_TIMEOUT)
+        return [(value, value) for value in values if value]
 
     def queryset(self, request, queryset):
         if self.value():
-            return queryset.filter(transformer=self.value())
+            return queryset.filter(**{self.field_name: self.value()})
         return queryset
 
 
+class TransformerListFilter(CachedDistinctValuesListFilter):
+    """Custom filter for transformer names"""
+
+    title = "transformer"
+    parameter_name = "transformer"
+    model = MigrationLog
+    field_name = "transformer"
+    cache_key = TRANSFORMER_NAMES_CACHE_KEY
+
+
+class UserListFilter(CachedDistinctValuesListFilter):
+    """Custom filter for the user who started a migration session"""
+
+    title = "user"
+    parameter_name = "user"
+    model = MigrationRunSummary
+    field_name = "user"
+    cache_key = USER_NAMES_CACHE_KEY
+
+
 class DurationListFilter(admin.SimpleListFilter):
     """Custom filter for migration duration"""
 
@@ -58,7 +207,6 @@ class DurationListFilter(admin.SimpleListFilter):
         return queryset
 
 
-@admin.register(MigrationLog)
 class MigrationLogAdmin(admin.ModelAdmin):
     """
     Enhanced admin interface for MigrationLog with filtering and detailed views
@@ -83,6 +231,7 @@ class MigrationLogAdmin(admin.ModelAdmin):
         DurationListFilter,
     ]
 
+    # Backed by trigram indexes on PostgreSQL (migration 0004)
     search_fields = [
         "transformer",
         "error_message",
@@ -116,26 +265,24 @@ class MigrationLogAdmin(admin.ModelAdmin):
 
     list_per_page = 50
 
+    # Avoid exact COUNT(*) queries on large log tables
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    # MigrationLog has no foreign keys, so there is nothing to join
+    list_select_related = False
+
     actions = ["export_migration_data", "mark_for_review"]
 
     def success_status(self, obj):
         """Display success status with colored icons"""
-        if obj.success:
-            return format_html('<span style="color: green;">✅ Success</span>')
-        else:
-            return format_html('<span style="color: red;">❌ Failed</span>')
+        return SUCCESS_LABEL if obj.success else FAILED_LABEL
 
     success_status.short_description = "Status"
 
     def dry_run_badge(self, obj):
         """Display dry run badge"""
-        if obj.dry_run:
-            return format_html(
-                '<span style="background: #ffc107; color: black; padding: 2px 6px; border-radius: 3px; font-size: 11px;">DRY RUN</span>'
-            )
-        return format_html(
-            '<span style="background: #28a745; color: white; padding: 2px 6px; border-radius: 3px; font-size: 11px;">LIVE</span>'
-        )
+        return DRY_RUN_BADGE if obj.dry_run else LIVE_BADGE
 
     dry_run_badge.short_description = "Mode"
 
@@ -147,31 +294,30 @@ class MigrationLogAdmin(admin.ModelAdmin):
 
     def performance_summary_short(self, obj):
         """Display short performance summary"""
-        summary = obj.get_performance_summary()
-        if len(summary) > 50:
-            return summary[:47] + "..."
-        return summary
+        if not obj.performance_summary_cached:
+            # Rows saved before the summary columns existed
+            obj.refresh_summary_cache()
+        return obj.performance_summary_cached
 
     performance_summary_short.short_description = "Performance"
 
     def validation_summary_short(self, obj):
         """Display short validation summary"""
-        summary = obj.get_validation_summary()
-        if len(summary) > 40:
-            return summary[:37] + "..."
-        return summary
+        if not obj.validation_summary_cached:
+            obj.refresh_summary_cache()
+        return obj.validation_summary_cached
 
     validation_summary_short.short_description = "Validation"
 
     def performance_summary(self, obj):
         """Display detailed performance summary"""
-        return format_html("<pre>{}</pre>", obj.get_performance_summary())
+        return preformatted(obj.get_performance_summary())
 
     performance_summary.short_description = "Performance Details"
 
     def validation_summary(self, obj):
         """Display detailed validation summary"""
-        return format_html("<pre>{}</pre>", obj.get_validation_summary())
+        return preformatted(obj.get_validation_summary())
 
     validation_summary.short_description = "Validation Details"
 
@@ -179,8 +325,8 @@ class MigrationLogAdmin(admin.ModelAdmin):
         """Display statistics in a formatted way"""
         stats = obj.statistics
         if stats:
-            formatted = json.dumps(stats, indent=2)
-            return format_html("<pre>{}</pre>", formatted)
+            formatted = jsonutils.dumps(stats, indent=True)
+            return preformatted(formatted)
         return "No statistics available"
 
     statistics_display.short_description = "Statistics"
@@ -189,55 +335,81 @@ class MigrationLogAdmin(admin.ModelAdmin):
         """Display system info in a formatted way"""
         info = obj.system_info
         if info:
-            formatted = json.dumps(info, indent=2)
-            return format_html("<pre>{}</pre>", formatted)
+            formatted = jsonutils.dumps(info, indent=True)
+            return preformatted(formatted)
         return "No system info available"
 
     system_info_display.short_description = "System Information"
 
     def export_migration_data(self, request, queryset):
-        """Export selected migration data"""
-        # This would implement data export functionality
-        self.message_user(request, f"Exported {queryset.count()} migration records")
+        """Export selected migration data as a streamed CSV file"""
+        rows = queryset.values_list(*EXPORT_FIELDS).iterator(
+            chunk_size=EXPORT_CHUNK_SIZE
+        )
+        writer = csv.writer(EchoBuffer())
+
+        def stream():
+            yield writer.writerow(EXPORT_FIELDS)
+            for row in rows:
+                yield writer.writerow(row)
+
+        response = StreamingHttpResponse(stream(), content_type="text/csv")
+        response["Content-Disposition"] = 'attachment; filename="migration_logs.csv"'
+        return response
 
     export_migration_data.short_description = "Export migration data"
 
     def mark_for_review(self, request, queryset):
         """Mark migrations for review"""
         # This would implement review marking functionality
-        self.message_user(request, f"Marked {queryset.count()} migrations for review")
+        count = self._get_selected_count(request, queryset)
+        self.message_user(request, f"Marked {count} migrations for review")
 
     mark_for_review.short_description = "Mark for review"
 
+    def _get_selected_count(self, request, queryset):
+        """Count the rows an action applies to without a COUNT query when possible"""
+        if request.POST.get("select_across", "0") == "0":
+            return len(request.POST.getlist(helpers.ACTION_CHECKBOX_NAME))
+        return queryset.count()
+
     def get_queryset(self, request):
-        """Optimize queryset"""
-        return super().get_queryset(request).select_related()
+        """Skip columns the changelist never renders"""
+        queryset = super().get_queryset(request)
+        match = getattr(request, "resolver_match", None)
+        if match and match.url_name and match.url_name.endswith("_changelist"):
+            queryset = queryset.defer(
+                "statistics_json", "system_info_json", "error_message"
+            )
+        return queryset
+
+    def _get_summary_stats(self):
+        """Get summary statistics (recent activity = last 24 hours) in one query"""
+        recent_cutoff = timezone.now() - timedelta(hours=24)
+        return MigrationLog.objects.aggregate(
+            total=Count("id"),
+            successful=Count("id", filter=Q(success=True)),
+            failed=Count("id", filter=Q(success=False)),
+            recent=Count("id", filter=Q(run_at__gte=recent_cutoff)),
+        )
 
     def changelist_view(self, request, extra_context=None):
         """Add summary statistics to the changelist"""
         extra_context = extra_context or {}
 
-        # Get summary statistics
-        total_migrations = MigrationLog.objects.count()
-        successful_migrations = MigrationLog.objects.filter(success=True).count()
-        failed_migrations = MigrationLog.objects.filter(success=False).count()
-
-        # Recent activity (last 24 hours)
-        recent_cutoff = timezone.now() - timedelta(hours=24)
-        recent_migrations = MigrationLog.objects.filter(
-            run_at__gte=recent_cutoff
-        ).count()
+        stats = cache.get_or_set(
+            SUMMARY_STATS_CACHE_KEY,
+            self._get_summary_stats,
+            SUMMARY_STATS_CACHE_TIMEOUT,
+        )
 
         extra_context.update(
             {
                 "summary_stats": {
-                    "total": total_migrations,
-                    "successful": successful_migrations,
-                    "failed": failed_migrations,
-                    "recent": recent_migrations,
+                    **stats,
                     "success_rate": (
-                        (successful_migrations / total_migrations * 100)
-                        if total_migrations > 0
+                        (stats["successful"] / stats["total"] * 100)
+                        if stats["total"] > 0
                         else 0
                     ),
                 }
@@ -247,7 +419,6 @@ class MigrationLogAdmin(admin.ModelAdmin):
         return super().changelist_view(request, extra_context)
 
 
-@admin.register(MigrationRunSummary)
 class MigrationRunSummaryAdmin(admin.ModelAdmin):
     """
     Admin interface for MigrationRunSummary
@@ -268,7 +439,7 @@ class MigrationRunSummaryAdmin(admin.ModelAdmin):
         "dry_run",
         "started_at",
         "completed_at",
-        "user",
+        UserListFilter,
     ]
 
     search_fields = [
@@ -301,14 +472,35 @@ class MigrationRunSummaryAdmin(admin.ModelAdmin):
 
     date_hierarchy = "started_at"
 
+    def get_queryset(self, request):
+        """Compute duration and success rate in the database"""
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                duration_value=ExpressionWrapper(
+                    F("completed_at") - F("started_at"),
+                    output_field=DurationField(),
+                ),
+                success_rate_value=Case(
+                    When(total_transformers=0, then=Value(None)),
+                    default=ExpressionWrapper(
+                        100.0 * F("successful_transformers") / F("total_transformers"),
+                        output_field=FloatField(),
+                    ),
+                    output_field=FloatField(),
+                ),
+            )
+        )
+
     def status_display(self, obj):
         """Display status with colored icons"""
         if not obj.is_complete:
-            return format_html('<span style="color: orange;">🔄 In Progress</span>')
+            return IN_PROGRESS_LABEL
         elif obj.is_successful:
-            return format_html('<span style="color: green;">✅ Completed</span>')
+            return COMPLETED_LABEL
         else:
-            return format_html('<span style="color: red;">❌ Failed</span>')
+            return FAILED_LABEL
 
     status_display.short_description = "Status"
 
@@ -320,30 +512,27 @@ class MigrationRunSummaryAdmin(admin.ModelAdmin):
 
     def dry_run_badge(self, obj):
         """Display dry run badge"""
-        if obj.dry_run:
-            return format_html(
-                '<span style="background: #ffc107; color: black; padding: 2px 6px; border-radius: 3px; font-size: 11px;">DRY RUN</span>'
-            )
-        return format_html(
-            '<span style="background: #28a745; color: white; padding: 2px 6px; border-radius: 3px; font-size: 11px;">LIVE</span>'
-        )
+        return DRY_RUN_BADGE if obj.dry_run else LIVE_BADGE
 
     dry_run_badge.short_description = "Mode"
 
     def formatted_duration(self, obj):
         """Display formatted duration"""
-        return obj.get_formatted_duration()
+        if obj.duration_value is None:
+            return "In progress..."
+        return format_duration(obj.duration_value.total_seconds())
 
     formatted_duration.short_description = "Duration"
+    formatted_duration.admin_order_field = "duration_value"
 
     def success_rate(self, obj):
-        """Calculate and display success rate"""
-        if obj.total_transformers == 0:
+        """Display success rate"""
+        if obj.success_rate_value is None:
             return "N/A"
-        rate = (obj.successful_transformers / obj.total_transformers) * 100
-        return f"{rate:.1f}%"
+        return f"{obj.success_rate_value:.1f}%"
 
     success_rate.short_description = "Success Rate"
+    success_rate.admin_order_field = "success_rate_value"
 
 
 # Custom admin site configuration
@@ -359,28 +548,43 @@ class ETLAdminSite(admin.AdminSite):
         extra_context = extra_context or {}
 
         # Add ETL-specific dashboard data
-        recent_cutoff = timezone.now() - timedelta(hours=24)
+        extra_context["etl_stats"] = cache.get_or_set(
+            DASHBOARD_STATS_CACHE_KEY,
+            self._get_etl_stats,
+            DASHBOARD_STATS_CACHE_TIMEOUT,
+        )
 
-        etl_stats = {
-            "recent_migrations": MigrationLog.objects.filter(
-                run_at__gte=recent_cutoff
-            ).count(),
-            "failed_migrations_today": MigrationLog.objects.filter(
-                run_at__gte=recent_cutoff, success=False
-            ).count(),
-            "active_sessions": MigrationRunSummary.objects.filter(
-                completed_at__isnull=True
-            ).count(),
-        }
+        return super().index(request, extra_context)
 
-        extra_context["etl_stats"] = etl_stats
+    def _get_etl_stats(self):
+        """Get dashboard statistics for the last 24 hours"""
+        recent_cutoff = timezone.now() - timedelta(hours=24)
 
-        return super().index(request, extra_context)
+        etl_stats = MigrationLog.objects.aggregate(
+            recent_migrations=Count("id", filter=Q(run_at__gte=recent_cutoff)),
+            failed_migrations_today=Count(
+                "id", filter=Q(run_at__gte=recent_cutoff, success=False)
+            ),
+        )
+        etl_stats.update(
+            MigrationRunSummary.objects.aggregate(
+                active_sessions=Count("id", filter=Q(completed_at__isnull=True))
+            )
+        )
+        return etl_stats
 
 
 # Create ETL admin site instance
 etl_admin_site = ETLAdminSite(name="etl_admin")
 
-# Register models with the custom admin site
-etl_admin_site.register(MigrationLog, MigrationLogAdmin)
-etl_admin_site.register(MigrationRunSummary, MigrationRunSummaryAdmin)
+ETL_MODEL_ADMINS = {
+    MigrationLog: MigrationLogAdmin,
+    MigrationRunSummary: MigrationRunSummaryAdmin,
+}
+
+# Register models with the custom admin site, and with the default one unless
+# the project opts out to skip building a second set of ModelAdmin instances
+for model, model_admin in ETL_MODEL_ADMINS.items():
+    etl_admin_site.register(model, model_admin)
+    if get_etl_setting("REGISTER_DEFAULT_ADMIN", True):
+        admin.site.register(model, model_admin)
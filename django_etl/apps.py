@@ -11,5 +11,5 @@ class DjangoEtlConfig(AppConfig):
 
     def ready(self):
         """Initialize the ETL framework when Django starts"""
-        # Import signal handlers, if any
-        pass
+        # Import signal handlers
+        from . import signals  # noqa: F401
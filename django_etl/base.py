@@ -1,19 +1,44 @@
 # migration_core/base.py
 
 import logging
+import random
+import re
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from itertools import islice
+from operator import attrgetter
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
-from django.db import transaction, connections
+from django.db import transaction, connections, router
 from django.core.exceptions import ValidationError
 
 # Import new enhancements
+from . import bulk
 from .profiler import ETLProfiler
 from .validators import DataQualityValidator, ValidationSeverity
 from .rollback import ETLRollbackManager
 from .config import config_manager
 
+# Matches only the statement prefix, however long the SQL is
+SELECT_SQL_RE = re.compile(r"\s*SELECT", re.IGNORECASE)
+
+# Sentinel for dict lookups where None is a valid mapped value
+_MISSING = object()
+
+# Rows fetched per round trip when building ID mappings
+ID_MAPPING_CHUNK_SIZE = 10000
+
+
+@lru_cache(maxsize=None)
+def _required_fields_getter(required_fields):
+    """Build a getter returning a tuple of the given attributes of an instance"""
+    getter = attrgetter(*required_fields)
+    if len(required_fields) == 1:
+        return lambda instance: (getter(instance),)
+    return getter
+
 
 class BaseTransformer:
     """
@@ -21,6 +46,17 @@ class BaseTransformer:
     Provides common functionality for migrating legacy data.
     """
 
+    # Set to True to skip instance.full_clean() in validate_data
+    skip_full_clean = False
+
+    # Keys of transformers that must finish before this one starts
+    depends_on = ()
+
+    # Set to False to run without safe_run()'s transaction, so that
+    # bulk_create_with_logging can insert from worker threads. Batches
+    # committed before a failure then stay in the database.
+    atomic_run = True
+
     def __init__(self):
         self.errors = []
         self.warnings = []
@@ -32,11 +68,21 @@ class BaseTransformer:
 
         # New enhancements
         self.config = config_manager.get_transformation_config()
-        self.profiler = ETLProfiler()
-        self.validator = DataQualityValidator()
-        self.rollback_manager = ETLRollbackManager()
         self.migration_id = None
 
+    # Helpers are created on first use; many transformers never touch some of them
+    @cached_property
+    def profiler(self):
+        return ETLProfiler()
+
+    @cached_property
+    def validator(self):
+        return DataQualityValidator()
+
+    @cached_property
+    def rollback_manager(self):
+        return ETLRollbackManager()
+
     def run(self):
         """
         Override this method with your transformation logic.
@@ -70,8 +116,12 @@ class BaseTransformer:
 
         try:
             with self.profiler.profile_operation("total_migration"):
-                if dry_run:
-                    # Run without transaction for dry run
+                # Dry runs save nothing. Non-atomic transformers still get a
+                # savepoint inside an outer transaction (--single-transaction),
+                # where parallel inserts can't happen anyway.
+                if dry_run or not (
+                    self.atomic_run or transaction.get_connection().in_atomic_block
+                ):
                     result = self.run()
                 else:
                     with transaction.atomic():
@@ -134,18 +184,63 @@ class BaseTransformer:
         self.errors.append(message)
 
     # ETL Utility Methods
-    def extract_data(self, model_class, filters=None, batch_size=1000):
+    def extract_data(
+        self, model_class, filters=None, batch_size=1000, use_iterator=True
+    ):
         """
         Extract data from legacy database with optional filtering and batching
 
+        By default rows are streamed through a single QuerySet.iterator()
+        cursor (server-side on PostgreSQL) and regrouped into batches, so
+        memory stays flat and the table is read in one query. With
+        use_iterator=False batches are paginated on the primary key
+        (WHERE pk > last_pk) instead, one query per batch.
+
         Args:
             model_class: Django model class to extract from
             filters: Dict of filter conditions
             batch_size: Number of records to fetch at once
+            use_iterator: Stream rows through one cursor instead of paginating
 
         Yields:
-            Batches of model instances
+            Batches of model instances, ordered by primary key
         """
+        queryset = self._get_extract_queryset(model_class, filters)
+
+        if use_iterator:
+            batches = self._iter_streamed_batches(queryset, batch_size)
+        else:
+            batches = self._iter_keyset_batches(queryset, batch_size)
+
+        yield from self._log_extracted_batches(batches)
+
+    def extract_data_with_prefetch(
+        self, model_class, prefetch_related, filters=None, batch_size=1000
+    ):
+        """
+        Extract data like extract_data, prefetching related objects per batch
+
+        QuerySet.iterator() ignores prefetch_related on the Django versions we
+        support, so this always uses primary key pagination.
+
+        Args:
+            model_class: Django model class to extract from
+            prefetch_related: List of lookups to pass to prefetch_related()
+            filters: Dict of filter conditions
+            batch_size: Number of records to fetch at once
+
+        Yields:
+            Batches of model instances, ordered by primary key
+        """
+        queryset = self._get_extract_queryset(model_class, filters)
+        queryset = queryset.prefetch_related(*prefetch_related)
+
+        yield from self._log_extracted_batches(
+            self._iter_keyset_batches(queryset, batch_size)
+        )
+
+    def _get_extract_queryset(self, model_class, filters):
+        """Build the primary key ordered queryset read by extract_data"""
         self.log_info(f"Extracting data from {model_class.__name__}")
 
         queryset = model_class.objects.using(self.legacy_db)
@@ -153,21 +248,55 @@ class BaseTransformer:
         if filters:
             queryset = queryset.filter(**filters)
 
-        total_count = queryset.count()
-        self.log_info(f"Found {total_count} records to process")
-        self.stats["total_extracted"] = total_count
+        return queryset.order_by("pk")
 
-        for i in range(0, total_count, batch_size):
-            batch = list(queryset[i : i + batch_size])
-            self.log_info(
-                f"Processing batch {i//batch_size + 1} ({len(batch)} records)"
-            )
+    def _log_extracted_batches(self, batches):
+        """Track and log extracted batches as they are yielded"""
+        self.stats["total_extracted"] = 0
+        log_batches = self.logger.isEnabledFor(logging.INFO)
+
+        for batch_number, batch in enumerate(batches, start=1):
+            self.stats["total_extracted"] += len(batch)
+            if log_batches:
+                self.logger.info(
+                    "Processing batch %d (%d records)", batch_number, len(batch)
+                )
             yield batch
 
+        self.log_info(f"Extracted {self.stats['total_extracted']} records")
+
+    @staticmethod
+    def _iter_streamed_batches(queryset, batch_size):
+        """Regroup a single streaming cursor into lists of batch_size rows"""
+        rows = queryset.iterator(chunk_size=batch_size)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            yield batch
+
+    @staticmethod
+    def _iter_keyset_batches(queryset, batch_size):
+        """Paginate a primary key ordered queryset with WHERE pk > last_pk"""
+        last_pk = None
+        while True:
+            page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+            batch = list(page[:batch_size])
+            if not batch:
+                break
+
+            last_pk = batch[-1].pk
+            yield batch
+
+            if len(batch) < batch_size:
+                break
+
     def check_duplicates(self, target_model, field_name, value):
         """
         Check if a record already exists in the target database
 
+        Runs one query per call; use check_duplicates_bulk inside batch loops.
+
         Args:
             target_model: Django model class to check against
             field_name: Field name to check
@@ -182,14 +311,63 @@ class BaseTransformer:
             self.log_error(f"Error checking duplicates for {field_name}={value}: {e}")
             return None
 
-    def bulk_create_with_logging(self, model_class, instances, batch_size=1000):
+    def check_duplicates_bulk(self, target_model, field_name, values):
+        """
+        Check which of many values already exist in the target database
+
+        Prefer this over calling check_duplicates for every row of a batch:
+        it runs one IN query per batch instead of one query per value.
+
+        Args:
+            target_model: Django model class to check against
+            field_name: Concrete field name to check
+            values: Values to look for
+
+        Returns:
+            Dict mapping each value found to its first existing instance
+        """
+        values = list(dict.fromkeys(v for v in values if v is not None))
+        if not values:
+            return {}
+
+        database = router.db_for_read(target_model)
+        chunk_size = connections[database].features.max_query_params or len(values)
+
+        existing = {}
+        try:
+            for i in range(0, len(values), chunk_size):
+                queryset = target_model.objects.using(database).filter(
+                    **{f"{field_name}__in": values[i : i + chunk_size]}
+                )
+                for instance in queryset.order_by("pk"):
+                    existing.setdefault(getattr(instance, field_name), instance)
+        except Exception as e:
+            self.log_error(f"Error checking duplicates for {field_name}: {e}")
+            return {}
+
+        return existing
+
+    def bulk_create_with_logging(
+        self, model_class, instances, batch_size=None, fast_insert=False
+    ):
         """
         Bulk create instances with progress logging
 
         Args:
             model_class: Target model class
             instances: List of model instances to create
-            batch_size: Number of instances to create per batch
+            batch_size: Number of instances to create per batch. Defaults to
+                the BULK_CREATE_BATCH_SIZE setting, or a per-backend size
+                capped by the bind parameter limit.
+            fast_insert: Load through COPY (PostgreSQL) or multi-row INSERT
+                (MySQL) where supported. Primary keys are not set on the
+                instances afterwards.
+
+        Batches are inserted from a pool of config.max_workers threads when
+        config.parallel_processing is enabled, the database is not SQLite and
+        no transaction is open. Worker threads use their own connections, so
+        they cannot take part in an enclosing transaction: safe_run() opens
+        one unless the transformer sets atomic_run = False.
 
         Returns:
             Number of created instances
@@ -210,25 +388,158 @@ class BaseTransformer:
             self.stats["created"] = total
             return total
 
-        for i in range(0, total, batch_size):
-            batch = instances[i : i + batch_size]
-            try:
+        database = router.db_for_write(model_class)
+        batch_size = batch_size or bulk.optimal_batch_size(
+            model_class, using=database, override=self.config.bulk_create_batch_size
+        )
+        use_fast_insert = fast_insert and bulk.supports_fast_insert(
+            model_class, instances, using=database
+        )
+
+        def insert_batch(batch):
+            if use_fast_insert:
+                bulk.fast_insert(model_class, batch, using=database)
+            else:
                 model_class.objects.bulk_create(batch, batch_size=batch_size)
+
+        numbered_batches = [
+            (i // batch_size + 1, instances[i : i + batch_size])
+            for i in range(0, total, batch_size)
+        ]
+
+        if self._can_insert_in_parallel(database, len(numbered_batches)):
+            results = self._insert_batches_parallel(insert_batch, numbered_batches)
+        else:
+            results = self._insert_batches(insert_batch, numbered_batches)
+
+        log_batches = self.logger.isEnabledFor(logging.INFO)
+        for number, batch, error in results:
+            if error is None:
                 created_count += len(batch)
-                self.log_info(
-                    f"Created batch {i//batch_size + 1}: {len(batch)} instances"
-                )
-            except Exception as e:
-                self.log_error(f"Error creating batch {i//batch_size + 1}: {e}")
+                if log_batches:
+                    self.logger.info("Created batch %d: %d instances", number, len(batch))
+            else:
+                self.log_error(f"Error creating batch {number}: {error}")
 
         self.stats["created"] = created_count
         self.log_info(f"Successfully created {created_count}/{total} instances")
         return created_count
 
+    def bulk_copy_from_queryset(
+        self, source_queryset, target_model, field_map, batch_size=None
+    ):
+        """
+        Copy rows from a queryset into another model without building instances
+
+        Source rows are streamed as values_list() tuples and written with
+        COPY (PostgreSQL) or executemany(), skipping model construction on
+        both sides. Target columns missing from field_map must be nullable or
+        have a database default, and no save() or pre_save logic runs.
+
+        Args:
+            source_queryset: Queryset to read from (e.g. on the legacy database)
+            target_model: Model class to insert into
+            field_map: Dict mapping source field names to target field names
+            batch_size: Number of rows per insert. Defaults as in
+                bulk_create_with_logging.
+
+        Returns:
+            Number of copied rows
+        """
+        source_name = source_queryset.model.__name__
+        self.log_info(f"Copying {source_name} rows into {target_model.__name__}")
+
+        database = router.db_for_write(target_model)
+        batch_size = batch_size or bulk.optimal_batch_size(
+            target_model, using=database, override=self.config.bulk_create_batch_size
+        )
+        target_fields = [target_model._meta.get_field(name) for name in field_map.values()]
+        batches = self._iter_streamed_batches(
+            source_queryset.values_list(*field_map), batch_size
+        )
+
+        if self.dry_run:
+            total = sum(len(batch) for batch in batches)
+            self.log_info(
+                f"DRY RUN: Would copy {total} rows into {target_model.__name__}"
+            )
+            self.stats["created"] = total
+            return total
+
+        copied_count = 0
+        log_batches = self.logger.isEnabledFor(logging.INFO)
+        for number, batch in enumerate(batches, start=1):
+            try:
+                bulk.insert_values(target_model, target_fields, batch, using=database)
+            except Exception as e:
+                self.log_error(f"Error copying batch {number}: {e}")
+                continue
+
+            copied_count += len(batch)
+            if log_batches:
+                self.logger.info("Copied batch %d: %d rows", number, len(batch))
+
+        self.stats["created"] = copied_count
+        self.log_info(f"Successfully copied {copied_count} rows")
+        return copied_count
+
+    def _can_insert_in_parallel(self, database, batch_count):
+        """Check whether bulk create batches may be spread over worker threads"""
+        if not self.config.parallel_processing or self.config.max_workers < 2:
+            return False
+        if batch_count < 2:
+            return False
+
+        connection = connections[database]
+        if connection.vendor == "sqlite":
+            return False
+        if connection.in_atomic_block:
+            self.logger.debug(
+                "Inserting batches serially: worker threads cannot join the open transaction"
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _insert_batches(insert_batch, numbered_batches):
+        """Insert batches one by one, yielding (number, batch, error) tuples"""
+        for number, batch in numbered_batches:
+            try:
+                insert_batch(batch)
+            except Exception as e:
+                yield number, batch, e
+            else:
+                yield number, batch, None
+
+    def _insert_batches_parallel(self, insert_batch, numbered_batches):
+        """Insert batches from a thread pool, returning results in batch order"""
+        workers = min(self.config.max_workers, len(numbered_batches))
+        groups = [numbered_batches[worker::workers] for worker in range(workers)]
+
+        def insert_group(group):
+            try:
+                return list(self._insert_batches(insert_batch, group))
+            finally:
+                # Each worker thread opened its own connections
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = [
+                result
+                for group_results in executor.map(insert_group, groups)
+                for result in group_results
+            ]
+
+        return sorted(results, key=lambda result: result[0])
+
     def validate_data(self, instance, required_fields=None):
         """
         Validate model instance data
 
+        Model validation (full_clean) is skipped when the transformer sets
+        skip_full_clean = True, e.g. when rows were already validated with
+        validate_batch_with_rules.
+
         Args:
             instance: Model instance to validate
             required_fields: List of required field names
@@ -240,9 +551,19 @@ class BaseTransformer:
 
         # Check required fields
         if required_fields:
-            for field in required_fields:
-                if not hasattr(instance, field) or getattr(instance, field) is None:
-                    errors.append(f"Missing required field: {field}")
+            required_fields = tuple(required_fields)
+            try:
+                values = _required_fields_getter(required_fields)(instance)
+            except AttributeError:
+                values = [getattr(instance, field, None) for field in required_fields]
+            errors.extend(
+                f"Missing required field: {field}"
+                for field, value in zip(required_fields, values)
+                if value is None
+            )
+
+        if self.skip_full_clean:
+            return len(errors) == 0, errors
 
         # Run model validation
         try:
@@ -280,6 +601,9 @@ class BaseTransformer:
         """
         Map legacy foreign key to new foreign key using a mapping dictionary
 
+        On hot paths where a silent fallback is fine, use mapping_dict.get()
+        or index a collections.defaultdict directly to skip the logging.
+
         Args:
             legacy_id: Legacy foreign key value
             mapping_dict: Dictionary mapping legacy IDs to new IDs
@@ -288,8 +612,9 @@ class BaseTransformer:
         Returns:
             Mapped foreign key or default
         """
-        if legacy_id in mapping_dict:
-            return mapping_dict[legacy_id]
+        mapped = mapping_dict.get(legacy_id, _MISSING)
+        if mapped is not _MISSING:
+            return mapped
 
         if default is not None:
             self.log_warning(
@@ -312,9 +637,11 @@ class BaseTransformer:
         Returns:
             Query results
         """
+        is_select = SELECT_SQL_RE.match(sql) is not None
+
         if self.dry_run:
             self.log_info(f"DRY RUN: Would execute SQL: {sql[:100]}...")
-            if sql.strip().upper().startswith("SELECT"):
+            if is_select:
                 # For SELECT queries, we can safely execute them in dry run
                 pass
             else:
@@ -325,7 +652,7 @@ class BaseTransformer:
         try:
             with connections[database].cursor() as cursor:
                 cursor.execute(sql, params or [])
-                if sql.strip().upper().startswith("SELECT"):
+                if is_select:
                     return cursor.fetchall()
                 return cursor.rowcount
         except Exception as e:
@@ -333,7 +660,12 @@ class BaseTransformer:
             raise
 
     def create_id_mapping(
-        self, legacy_model, target_model, legacy_field="id", target_field="legacy_id"
+        self,
+        legacy_model,
+        target_model,
+        legacy_field="id",
+        target_field="legacy_id",
+        ids_only=False,
     ):
         """
         Create a mapping dictionary between legacy and new IDs
@@ -343,24 +675,33 @@ class BaseTransformer:
             target_model: Target model class
             legacy_field: Field name in legacy model
             target_field: Field name in target model that stores legacy ID
+            ids_only: Map to primary keys instead of model instances. Much
+                cheaper on large tables; assign the result to the foreign
+                key's *_id attribute.
 
         Returns:
-            Dictionary mapping legacy IDs to new instances
+            Dictionary mapping legacy IDs to new instances (or primary keys)
         """
         self.log_info(
             f"Creating ID mapping between {legacy_model.__name__} and {target_model.__name__}"
         )
 
-        mapping = {}
-
         # Get all target instances that have legacy IDs
         target_instances = target_model.objects.filter(
             **{f"{target_field}__isnull": False}
         )
 
-        for instance in target_instances:
-            legacy_id = getattr(instance, target_field)
-            mapping[legacy_id] = instance
+        if ids_only:
+            mapping = dict(
+                target_instances.values_list(target_field, "pk").iterator(
+                    chunk_size=ID_MAPPING_CHUNK_SIZE
+                )
+            )
+        else:
+            mapping = {}
+            for instance in target_instances.iterator(chunk_size=ID_MAPPING_CHUNK_SIZE):
+                legacy_id = getattr(instance, target_field)
+                mapping[legacy_id] = instance
 
         self.log_info(f"Created mapping for {len(mapping)} records")
         return mapping
@@ -479,27 +820,22 @@ class BaseTransformer:
             "successful_batches": 0,
             "failed_batches": 0,
             "retried_batches": 0,
+            "retry_attempts": 0,
             "total_records": 0,
         }
 
-        batch = []
-        for item in data_source:
-            batch.append(item)
+        items = iter(data_source)
+        with self.profiler.profile_operation("batch_processing"):
+            while True:
+                batch = list(islice(items, batch_size))
+                if not batch:
+                    break
 
-            if len(batch) >= batch_size:
                 self._process_batch_with_retry(
                     batch, process_func, max_retries, retry_delay, results
                 )
-                batch = []
                 results["total_batches"] += 1
 
-        # Process remaining items
-        if batch:
-            self._process_batch_with_retry(
-                batch, process_func, max_retries, retry_delay, results
-            )
-            results["total_batches"] += 1
-
         return results
 
     def _process_batch_with_retry(
@@ -510,13 +846,20 @@ class BaseTransformer:
         retry_delay: int,
         results: Dict[str, Any],
     ):
-        """Process a single batch with retry logic"""
+        """
+        Process a single batch with retry logic
+
+        First attempts run inside the caller's single "batch_processing"
+        profile; only retries get their own profiled span.
+        """
         for attempt in range(max_retries + 1):
             try:
-                with self.profiler.profile_operation(
-                    f"batch_processing_attempt_{attempt}"
-                ):
+                if attempt == 0:
                     process_func(batch)
+                else:
+                    results["retry_attempts"] += 1
+                    with self.profiler.profile_operation("batch_processing_retry"):
+                        process_func(batch)
                 results["successful_batches"] += 1
                 results["total_records"] += len(batch)
                 if attempt > 0:
@@ -527,13 +870,18 @@ class BaseTransformer:
                     self.log_warning(
                         f"Batch processing failed (attempt {attempt + 1}/{max_retries + 1}): {e}"
                     )
-                    time.sleep(retry_delay)
+                    time.sleep(self._get_retry_backoff(attempt, retry_delay))
                 else:
                     self.log_error(
                         f"Batch processing failed after {max_retries + 1} attempts: {e}"
                     )
                     results["failed_batches"] += 1
 
+    def _get_retry_backoff(self, attempt: int, retry_delay: float) -> float:
+        """Exponential backoff with jitter, so parallel workers don't retry in lockstep"""
+        delay = retry_delay * (2**attempt) + random.uniform(0, retry_delay)
+        return min(delay, self.config.max_retry_delay)
+
     def get_performance_report(self) -> Dict[str, Any]:
         """Get detailed performance report"""
         return self.profiler.get_performance_report()
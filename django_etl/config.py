@@ -4,13 +4,26 @@ Provides centralized configuration management for ETL operations using Django se
 """
 
 import os
+import sys
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 
+# Config objects drop their per-instance __dict__ where dataclasses support it
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _env_int(name: str) -> Optional[int]:
+    """Positive integer from an environment variable, None if unset or invalid"""
+    try:
+        value = int(os.environ.get(name, 0))
+    except (TypeError, ValueError):
+        return None
+    return value if value > 0 else None
+
+
+@dataclass(**DATACLASS_SLOTS)
 class DatabaseConfig:
     """Database configuration from Django DATABASES setting"""
 
@@ -38,21 +51,27 @@ class DatabaseConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TransformationConfig:
-    """Transformation-specific configuration from Django settings"""
+    """
+    Transformation-specific configuration from Django settings
+
+    Shared by every transformer; use dataclasses.replace() to override values.
+    """
 
     batch_size: int = 1000
     max_retries: int = 3
     retry_delay: int = 5
+    max_retry_delay: int = 60
     enable_validation: bool = True
     validation_mode: str = "strict"  # strict, lenient, warning_only
     cleanup_on_error: bool = True
     parallel_processing: bool = False
     max_workers: int = 4
+    bulk_create_batch_size: Optional[int] = None  # None picks one per backend
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LoggingConfig:
     """Logging configuration from Django settings"""
 
@@ -64,7 +83,7 @@ class LoggingConfig:
     console_output: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class MonitoringConfig:
     """Monitoring and alerting configuration from Django settings"""
 
@@ -74,14 +93,61 @@ class MonitoringConfig:
     alert_email: Optional[str] = None
     webhook_url: Optional[str] = None
     slack_channel: Optional[str] = None
+    max_samples_per_op: Optional[int] = 500  # None or 0 keeps every measurement
 
 
 class ETLConfigManager:
     """Django-native ETL configuration manager that uses Django settings"""
 
     def __init__(self):
+        self.reload()
+
+    def reload(self) -> None:
+        """Re-read ETL_CONFIG from Django settings and rebuild every config object"""
         self._etl_settings = getattr(settings, "ETL_CONFIG", {})
         self._validate_django_config()
+        self._config_validated = False
+        self._resolve_settings()
+
+        self._transformation_config = self._build_transformation_config()
+        self._logging_config = self._build_logging_config()
+        self._monitoring_config = self._build_monitoring_config()
+
+    def _resolve_settings(self) -> None:
+        """Resolve top-level settings once, so reading them is a plain attribute lookup"""
+        etl_settings = self._etl_settings
+        base_dir = getattr(settings, "BASE_DIR", "/tmp")
+
+        self.project_name: str = etl_settings.get(
+            "PROJECT_NAME", getattr(settings, "PROJECT_NAME", "Django-ETL")
+        )
+        self.environment: str = etl_settings.get(
+            "ENVIRONMENT", getattr(settings, "ENVIRONMENT", "development")
+        )
+
+        # Directories default to locations under BASE_DIR
+        self.backup_directory: str = etl_settings.get(
+            "BACKUP_DIRECTORY", os.path.join(base_dir, "etl_backups")
+        )
+        self.temp_directory: str = etl_settings.get(
+            "TEMP_DIRECTORY", os.path.join(base_dir, "etl_temp")
+        )
+        self.log_directory: str = etl_settings.get(
+            "LOG_DIRECTORY", os.path.join(base_dir, "logs", "etl")
+        )
+
+        # Feature flags
+        self.enable_rollback: bool = etl_settings.get("ENABLE_ROLLBACK", True)
+        self.enable_dry_run: bool = etl_settings.get("ENABLE_DRY_RUN", True)
+        self.enable_parallel_transforms: bool = etl_settings.get(
+            "ENABLE_PARALLEL_TRANSFORMS", False
+        )
+
+        # Rollback backups
+        rollback_settings = etl_settings.get("ROLLBACK", {})
+        self.compress_backups: bool = rollback_settings.get(
+            "COMPRESSION_ENABLED", False
+        )
 
     def _validate_django_config(self) -> None:
         """Validate ETL configuration against Django settings"""
@@ -99,21 +165,38 @@ class ETLConfigManager:
 
     def get_transformation_config(self) -> TransformationConfig:
         """Get transformation configuration from Django ETL_CONFIG setting"""
+        return self._transformation_config
+
+    def get_logging_config(self) -> LoggingConfig:
+        """Get logging configuration from Django ETL_CONFIG setting"""
+        return self._logging_config
+
+    def get_monitoring_config(self) -> MonitoringConfig:
+        """Get monitoring configuration from Django ETL_CONFIG setting"""
+        return self._monitoring_config
+
+    def _build_transformation_config(self) -> TransformationConfig:
+        """Build the transformation configuration from ETL_CONFIG"""
         transform_settings = self._etl_settings.get("TRANSFORMATION", {})
 
         return TransformationConfig(
             batch_size=transform_settings.get("BATCH_SIZE", 1000),
             max_retries=transform_settings.get("MAX_RETRIES", 3),
             retry_delay=transform_settings.get("RETRY_DELAY", 5),
+            max_retry_delay=transform_settings.get("MAX_RETRY_DELAY", 60),
             enable_validation=transform_settings.get("ENABLE_VALIDATION", True),
             validation_mode=transform_settings.get("VALIDATION_MODE", "strict"),
             cleanup_on_error=transform_settings.get("CLEANUP_ON_ERROR", True),
             parallel_processing=transform_settings.get("PARALLEL_PROCESSING", False),
             max_workers=transform_settings.get("MAX_WORKERS", 4),
+            bulk_create_batch_size=transform_settings.get(
+                "BULK_CREATE_BATCH_SIZE",
+                _env_int("ETL_BULK_CREATE_BATCH_SIZE"),
+            ),
         )
 
-    def get_logging_config(self) -> LoggingConfig:
-        """Get logging configuration from Django ETL_CONFIG setting"""
+    def _build_logging_config(self) -> LoggingConfig:
+        """Build the logging configuration from ETL_CONFIG"""
         logging_settings = self._etl_settings.get("LOGGING", {})
 
         return LoggingConfig(
@@ -127,8 +210,8 @@ class ETLConfigManager:
             console_output=logging_settings.get("CONSOLE_OUTPUT", True),
         )
 
-    def get_monitoring_config(self) -> MonitoringConfig:
-        """Get monitoring configuration from Django ETL_CONFIG setting"""
+    def _build_monitoring_config(self) -> MonitoringConfig:
+        """Build the monitoring configuration from ETL_CONFIG"""
         monitoring_settings = self._etl_settings.get("MONITORING", {})
 
         return MonitoringConfig(
@@ -138,63 +221,22 @@ class ETLConfigManager:
             alert_email=monitoring_settings.get("ALERT_EMAIL"),
             webhook_url=monitoring_settings.get("WEBHOOK_URL"),
             slack_channel=monitoring_settings.get("SLACK_CHANNEL"),
+            max_samples_per_op=monitoring_settings.get("MAX_SAMPLES_PER_OP", 500),
         )
 
-    @property
-    def project_name(self) -> str:
-        """Get project name from Django settings"""
-        return self._etl_settings.get(
-            "PROJECT_NAME", getattr(settings, "PROJECT_NAME", "Django-ETL")
-        )
-
-    @property
-    def environment(self) -> str:
-        """Get environment from Django settings"""
-        return self._etl_settings.get(
-            "ENVIRONMENT", getattr(settings, "ENVIRONMENT", "development")
-        )
-
-    @property
-    def backup_directory(self) -> str:
-        """Get backup directory from Django settings"""
-        default_backup = os.path.join(
-            getattr(settings, "BASE_DIR", "/tmp"), "etl_backups"
-        )
-        return self._etl_settings.get("BACKUP_DIRECTORY", default_backup)
-
-    @property
-    def temp_directory(self) -> str:
-        """Get temp directory from Django settings"""
-        default_temp = os.path.join(getattr(settings, "BASE_DIR", "/tmp"), "etl_temp")
-        return self._etl_settings.get("TEMP_DIRECTORY", default_temp)
-
-    @property
-    def log_directory(self) -> str:
-        """Get log directory from Django settings"""
-        default_log = os.path.join(getattr(settings, "BASE_DIR", "/tmp"), "logs", "etl")
-        return self._etl_settings.get("LOG_DIRECTORY", default_log)
-
-    @property
-    def enable_rollback(self) -> bool:
-        """Get rollback setting from Django settings"""
-        return self._etl_settings.get("ENABLE_ROLLBACK", True)
-
-    @property
-    def enable_dry_run(self) -> bool:
-        """Get dry run setting from Django settings"""
-        return self._etl_settings.get("ENABLE_DRY_RUN", True)
-
-    @property
-    def enable_parallel_transforms(self) -> bool:
-        """Get parallel transforms setting from Django settings"""
-        return self._etl_settings.get("ENABLE_PARALLEL_TRANSFORMS", False)
-
     def get_transformer_discovery_paths(self) -> List[str]:
         """Get transformer discovery paths from Django settings"""
         return self._etl_settings.get("TRANSFORMER_DISCOVERY_PATHS", [])
 
     def validate_config(self) -> List[str]:
-        """Validate configuration and return any issues"""
+        """
+        Validate configuration and return any issues
+
+        A configuration that passed once is not checked again until reload().
+        """
+        if self._config_validated:
+            return []
+
         issues = []
 
         # Validate required Django settings
@@ -220,11 +262,14 @@ class ETLConfigManager:
         directories = [self.backup_directory, self.temp_directory, self.log_directory]
 
         for directory in directories:
+            if os.path.isdir(directory):
+                continue
             try:
                 os.makedirs(directory, exist_ok=True)
             except Exception as e:
                 issues.append(f"Cannot create directory '{directory}': {e}")
 
+        self._config_validated = not issues
         return issues
 
 
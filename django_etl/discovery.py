@@ -1,7 +1,7 @@
 import importlib
 import pkgutil
-import inspect
 import logging
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +15,16 @@ def discover_transformers(base_paths):
 
     Returns:
         dict: A dictionary mapping transformer names to their import paths.
+
+    Results are cached per tuple of paths; call
+    discover_transformers.cache_clear() to pick up newly added modules.
     """
+    return dict(_discover_cached(tuple(base_paths)))
+
+
+@lru_cache(maxsize=None)
+def _discover_cached(base_paths):
+    """Walk the given packages once and collect their transformer classes"""
     transformers = {}
 
     for path in base_paths:
@@ -23,7 +32,7 @@ def discover_transformers(base_paths):
             package = importlib.import_module(path)
         except ImportError as e:
             # Only log debug message for missing modules - they're expected
-            logger.debug(f"Module {path} not found: {e}")
+            logger.debug("Module %s not found: %s", path, e)
             continue
 
         try:
@@ -34,21 +43,24 @@ def discover_transformers(base_paths):
                     continue
                 try:
                     module = importlib.import_module(module_name)
-                    for name, obj in inspect.getmembers(module):
-                        if (
-                            name.endswith("Transformer")
-                            and inspect.isclass(obj)
-                            and name != "BaseTransformer"
-                        ):  # Exclude the base class
-                            key = name.replace("Transformer", "").lower()
-                            transformers[key] = obj
-                            logger.info(f"Discovered transformer: {name} -> {key}")
+                    # Check the name before the type; most module globals fail it
+                    for name, obj in vars(module).items():
+                        if not name.endswith("Transformer") or name == "BaseTransformer":
+                            continue
+                        if not isinstance(obj, type):
+                            continue
+                        key = name.replace("Transformer", "").lower()
+                        transformers[key] = obj
+                        logger.info("Discovered transformer: %s -> %s", name, key)
                 except Exception as e:
-                    logger.debug(f"Could not import module {module_name}: {e}")
+                    logger.debug("Could not import module %s: %s", module_name, e)
                     continue
         except AttributeError:
             # Package doesn't have __path__ (not a package)
-            logger.debug(f"Path {path} is not a package")
+            logger.debug("Path %s is not a package", path)
             continue
 
     return transformers
+
+
+discover_transformers.cache_clear = _discover_cached.cache_clear
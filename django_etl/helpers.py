@@ -2,9 +2,105 @@
 
 import re
 import hashlib
+from collections import Counter
 from datetime import datetime, date
 from decimal import Decimal, InvalidOperation
-from typing import Any, Optional, Dict, List, Union
+from typing import Any, Optional, Dict, List, Tuple, Union, TYPE_CHECKING
+
+try:
+    import xxhash
+except ImportError:  # xxhash is an optional dependency
+    xxhash = None
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Patterns used on every row; compiled once instead of per call
+_WHITESPACE_RE = re.compile(r"\s+")
+_NON_DIGIT_RE = re.compile(r"\D")
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_CURRENCY_RE = re.compile(r"[$,]")
+_SPECIAL_CHARS_RE = re.compile(r"[^a-zA-Z0-9\s]")
+
+# Sentinel for attribute lookups where None is a meaningful value
+_MISSING = object()
+
+# Hash used where hashes only need to be consistent within one run
+DUPLICATE_HASH_ALGORITHM = "xxh3_64" if xxhash is not None else "md5"
+
+# Default parse_date formats, in priority order
+DEFAULT_DATE_FORMATS = (
+    "%Y-%m-%d",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%Y-%m-%d %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%d-%m-%Y",
+    "%Y%m%d",
+)
+_SLASH_DATE_FORMATS = tuple(fmt for fmt in DEFAULT_DATE_FORMATS if "/" in fmt)
+_DASH_DATE_FORMATS = tuple(fmt for fmt in DEFAULT_DATE_FORMATS if "-" in fmt)
+_DIGITS_DATE_FORMATS = ("%Y%m%d",)
+
+# Drops null bytes and carriage returns, turns newlines into spaces
+_CLEAN_STRING_TRANSLATION = str.maketrans({"\x00": None, "\r": None, "\n": " "})
+
+
+def _digits_only(value: str) -> str:
+    """Drop every character _NON_DIGIT_RE matches, without the regex engine"""
+    # str.isdecimal() and \d both test for the Unicode Nd category
+    return "".join(filter(str.isdecimal, value))
+
+
+def _is_valid_email(value: str) -> bool:
+    """Match _EMAIL_RE, rejecting obviously invalid values without running it"""
+    # The pattern needs exactly one "@" and at least "a@b.co"
+    if len(value) < 6 or value.count("@") != 1:
+        return False
+    return _EMAIL_RE.match(value) is not None
+
+
+def _candidate_date_formats(date_str: str) -> tuple:
+    """
+    Narrow DEFAULT_DATE_FORMATS to those that can match the string's separators
+
+    Skips strptime calls (and the ValueError each failure raises) for formats
+    that cannot match, keeping the default priority order among the rest.
+    """
+    if "/" in date_str:
+        return _SLASH_DATE_FORMATS
+    if "-" in date_str:
+        return _DASH_DATE_FORMATS
+    if date_str.isdigit():
+        return _DIGITS_DATE_FORMATS
+    return DEFAULT_DATE_FORMATS
+
+
+def _truthy_mask(values: "pd.Series") -> "pd.Series":
+    """Boolean mask of the values that are present and truthy, as `if value`"""
+    import pandas as pd
+
+    # Built per value: fillna(False) on object data and writing object
+    # results into a bool mask both raise pandas deprecation warnings
+    return values.map(lambda value: pd.notna(value) and bool(value)).astype(bool)
+
+
+def _none_mask(values: "pd.Series") -> "pd.Series":
+    """Boolean mask of the values the scalar cleaners see as None"""
+    # Object Series keep None as is, and NaN there is a value ('nan'); typed
+    # Series (str, float, ...) store None as their missing marker
+    if values.dtype == object:
+        return values.map(lambda value: value is None).astype(bool)
+    return values.isna()
+
+
+def _capitalize_name_word(word: str) -> str:
+    """Capitalize one word of a name, handling O'Brien and McDonald"""
+    if "'" in word:
+        return "'".join(part.capitalize() for part in word.split("'"))
+    if word[:2].lower() == "mc":
+        return "Mc" + word[2:].capitalize()
+    return word.capitalize()
 
 
 class DataCleaner:
@@ -34,10 +130,10 @@ class DataCleaner:
         cleaned = str(value).strip()
 
         # Replace multiple whitespaces with single space
-        cleaned = re.sub(r"\s+", " ", cleaned)
+        cleaned = _WHITESPACE_RE.sub(" ", cleaned)
 
         # Remove null bytes and other problematic characters
-        cleaned = cleaned.replace("\x00", "").replace("\r", "").replace("\n", " ")
+        cleaned = cleaned.translate(_CLEAN_STRING_TRANSLATION)
 
         # Truncate if necessary
         if max_length and len(cleaned) > max_length:
@@ -60,7 +156,7 @@ class DataCleaner:
             return None
 
         # Remove all non-digit characters
-        digits = re.sub(r"\D", "", str(phone))
+        digits = _digits_only(str(phone))
 
         # Return None if no digits found
         if not digits:
@@ -89,11 +185,16 @@ class DataCleaner:
         if not email:
             return None
 
+        # Trimming is enough for most emails; fall back to the full
+        # clean_string pass, which also drops stray control characters
+        cleaned = str(email).strip().lower()
+        if _is_valid_email(cleaned):
+            return cleaned
+
         cleaned = DataCleaner.clean_string(email).lower()
 
         # Basic email validation
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if re.match(email_pattern, cleaned):
+        if _is_valid_email(cleaned):
             return cleaned
 
         return None
@@ -116,18 +217,17 @@ class DataCleaner:
         if isinstance(date_value, (date, datetime)):
             return date_value.date() if isinstance(date_value, datetime) else date_value
 
+        date_str = str(date_value).strip()
+
         if formats is None:
-            formats = [
-                "%Y-%m-%d",
-                "%m/%d/%Y",
-                "%d/%m/%Y",
-                "%Y-%m-%d %H:%M:%S",
-                "%m/%d/%Y %H:%M:%S",
-                "%d-%m-%Y",
-                "%Y%m%d",
-            ]
+            # ISO dates are the common case and parse in C
+            if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-":
+                try:
+                    return date.fromisoformat(date_str)
+                except ValueError:
+                    pass
 
-        date_str = str(date_value).strip()
+            formats = _candidate_date_formats(date_str)
 
         for fmt in formats:
             try:
@@ -157,7 +257,7 @@ class DataCleaner:
         # Handle string values
         if isinstance(value, str):
             # Remove currency symbols and commas
-            cleaned = re.sub(r"[$,]", "", value.strip())
+            cleaned = _CURRENCY_RE.sub("", value.strip())
 
             # Handle parentheses as negative
             if cleaned.startswith("(") and cleaned.endswith(")"):
@@ -188,22 +288,85 @@ class DataCleaner:
         cleaned = DataCleaner.clean_string(name)
 
         # Title case each word
-        words = cleaned.split()
-        normalized_words = []
+        return " ".join(map(_capitalize_name_word, cleaned.split()))
+
+    # Batch variants of the cleaners above. They work on a whole pandas Series
+    # with vectorized string methods and give the same results per value.
+
+    @staticmethod
+    def clean_string_series(
+        values: "pd.Series", max_length: Optional[int] = None, default: str = ""
+    ) -> "pd.Series":
+        """
+        Clean a Series of values like clean_string
+
+        Args:
+            values: Series of input values
+            max_length: Maximum allowed length
+            default: Value for missing/empty inputs
+
+        Returns:
+            Series of cleaned strings
+        """
+        # str() per value as in clean_string; astype(str) can keep NaN as a
+        # missing value, where clean_string gives 'nan'
+        cleaned = (
+            values.map(str)
+            .astype(object)
+            .str.strip()
+            .str.replace(_WHITESPACE_RE, " ", regex=True)
+            .str.translate(_CLEAN_STRING_TRANSLATION)
+        )
+
+        if max_length:
+            cleaned = cleaned.str.slice(0, max_length).str.strip()
+
+        return cleaned.where((cleaned != "") & ~_none_mask(values), default)
+
+    @staticmethod
+    def clean_phone_series(values: "pd.Series") -> "pd.Series":
+        """
+        Clean and format a Series of phone numbers like clean_phone
+
+        Args:
+            values: Series of input phone numbers
 
-        for word in words:
-            # Handle special cases like "McDonald", "O'Brien"
-            if "'" in word:
-                parts = word.split("'")
-                word = "'".join([part.capitalize() for part in parts])
-            elif word.lower().startswith("mc"):
-                word = "Mc" + word[2:].capitalize()
-            else:
-                word = word.capitalize()
+        Returns:
+            Series of formatted phone numbers, None where there are no digits
+        """
+        digits = values.map(str).astype(object).str.replace(_NON_DIGIT_RE, "", regex=True)
+        length = digits.str.len()
+
+        ten_digits = (
+            "(" + digits.str[:3] + ") " + digits.str[3:6] + "-" + digits.str[6:]
+        )
+        eleven_digits = (
+            "+1 (" + digits.str[1:4] + ") " + digits.str[4:7] + "-" + digits.str[7:]
+        )
+
+        formatted = digits.where(length != 10, ten_digits)
+        formatted = formatted.where(
+            ~((length == 11) & digits.str.startswith("1")), eleven_digits
+        )
+
+        present = _truthy_mask(values) & (length > 0)
+        # object dtype, so the missing entries stay None rather than NaN
+        return formatted.astype(object).where(present, None)
+
+    @staticmethod
+    def clean_email_series(values: "pd.Series") -> "pd.Series":
+        """
+        Clean and validate a Series of email addresses like clean_email
 
-            normalized_words.append(word)
+        Args:
+            values: Series of input email addresses
 
-        return " ".join(normalized_words)
+        Returns:
+            Series of cleaned emails, None where invalid
+        """
+        cleaned = DataCleaner.clean_string_series(values).str.lower()
+        valid = cleaned.str.match(_EMAIL_RE, na=False)
+        return cleaned.astype(object).where(valid & _truthy_mask(values), None)
 
 
 class IDMapper:
@@ -212,7 +375,8 @@ class IDMapper:
     """
 
     def __init__(self):
-        self.mappings: Dict[str, Dict[Any, Any]] = {}
+        # Flat (table_name, legacy_id) keys need one hash lookup per access
+        self.mappings: Dict[Tuple[str, Any], Any] = {}
 
     def add_mapping(self, table_name: str, legacy_id: Any, new_id: Any):
         """
@@ -223,10 +387,7 @@ class IDMapper:
             legacy_id: Legacy system ID
             new_id: New system ID
         """
-        if table_name not in self.mappings:
-            self.mappings[table_name] = {}
-
-        self.mappings[table_name][legacy_id] = new_id
+        self.mappings[(table_name, legacy_id)] = new_id
 
     def get_mapping(self, table_name: str, legacy_id: Any, default: Any = None) -> Any:
         """
@@ -240,7 +401,7 @@ class IDMapper:
         Returns:
             Mapped ID or default
         """
-        return self.mappings.get(table_name, {}).get(legacy_id, default)
+        return self.mappings.get((table_name, legacy_id), default)
 
     def has_mapping(self, table_name: str, legacy_id: Any) -> bool:
         """
@@ -253,7 +414,7 @@ class IDMapper:
         Returns:
             True if mapping exists
         """
-        return legacy_id in self.mappings.get(table_name, {})
+        return (table_name, legacy_id) in self.mappings
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -262,7 +423,7 @@ class IDMapper:
         Returns:
             Dictionary with mapping counts per table
         """
-        return {table: len(mappings) for table, mappings in self.mappings.items()}
+        return dict(Counter(table for table, _ in self.mappings))
 
 
 class DataValidator:
@@ -287,11 +448,11 @@ class DataValidator:
         errors = []
 
         for field in required_fields:
-            if not hasattr(instance, field):
+            value = getattr(instance, field, _MISSING)
+            if value is _MISSING:
                 errors.append(f"Missing field: {field}")
                 continue
 
-            value = getattr(instance, field)
             if value is None or (isinstance(value, str) and not value.strip()):
                 errors.append(f"Required field is empty: {field}")
 
@@ -314,12 +475,16 @@ class DataValidator:
         errors = []
 
         for field, max_length in field_limits.items():
-            if hasattr(instance, field):
-                value = getattr(instance, field)
-                if value and len(str(value)) > max_length:
-                    errors.append(
-                        f"Field '{field}' exceeds max length {max_length}: {len(str(value))}"
-                    )
+            # Missing fields are skipped just like empty ones
+            value = getattr(instance, field, None)
+            if not value:
+                continue
+
+            length = len(str(value))
+            if length > max_length:
+                errors.append(
+                    f"Field '{field}' exceeds max length {max_length}: {length}"
+                )
 
         return errors
 
@@ -337,8 +502,7 @@ class DataValidator:
         if not email:
             return False
 
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        return bool(re.match(pattern, email))
+        return _is_valid_email(email)
 
 
 class HashGenerator:
@@ -347,24 +511,41 @@ class HashGenerator:
     """
 
     @staticmethod
-    def generate_record_hash(fields: Dict[str, Any]) -> str:
+    def generate_record_hash(fields: Dict[str, Any], algorithm: str = "md5") -> str:
         """
         Generate a hash for a record based on specific fields
 
         Args:
             fields: Dictionary of field names and values
+            algorithm: "xxh3_64" (requires xxhash) or any hashlib algorithm.
+                Keep the MD5 default for hashes that are stored or compared
+                across environments.
 
         Returns:
-            MD5 hash string
+            Hex digest string
         """
-        # Sort fields to ensure consistent hash
-        sorted_fields = sorted(fields.items())
+        hasher = HashGenerator._new_hasher(algorithm)
+
+        # Feed "key:value" pairs joined by "|" in sorted order, without
+        # building the joined string first
+        separator = b""
+        for key, value in sorted(fields.items()):
+            if value is None:
+                continue
+            hasher.update(separator)
+            hasher.update(f"{key}:{value}".encode("utf-8"))
+            separator = b"|"
 
-        # Create string representation
-        field_str = "|".join([f"{k}:{v}" for k, v in sorted_fields if v is not None])
+        return hasher.hexdigest()
 
-        # Generate hash
-        return hashlib.md5(field_str.encode("utf-8")).hexdigest()
+    @staticmethod
+    def _new_hasher(algorithm: str):
+        """Create a hash object for generate_record_hash"""
+        if algorithm == "xxh3_64":
+            if xxhash is None:
+                raise ImportError("The xxh3_64 algorithm requires the xxhash package")
+            return xxhash.xxh3_64()
+        return hashlib.new(algorithm)
 
     @staticmethod
     def find_duplicates(
@@ -373,6 +554,8 @@ class HashGenerator:
         """
         Find duplicate records based on specific fields
 
+        Hashes with xxh3_64 when xxhash is installed, MD5 otherwise.
+
         Args:
             records: List of record dictionaries
             fields: List of field names to use for duplicate detection
@@ -384,7 +567,9 @@ class HashGenerator:
 
         for idx, record in enumerate(records):
             field_values = {field: record.get(field) for field in fields}
-            record_hash = HashGenerator.generate_record_hash(field_values)
+            record_hash = HashGenerator.generate_record_hash(
+                field_values, DUPLICATE_HASH_ALGORITHM
+            )
 
             if record_hash not in hash_to_indices:
                 hash_to_indices[record_hash] = []
@@ -396,6 +581,35 @@ class HashGenerator:
             h: indices for h, indices in hash_to_indices.items() if len(indices) > 1
         }
 
+    @staticmethod
+    def find_duplicates_frame(
+        frame: "pd.DataFrame", fields: List[str]
+    ) -> Dict[str, List[int]]:
+        """
+        Find duplicate rows of a DataFrame based on specific columns
+
+        Vectorized counterpart of find_duplicates for large extracts. Rows
+        are hashed in C by pandas, so the hashes differ from find_duplicates.
+
+        Args:
+            frame: DataFrame of records
+            fields: List of column names to use for duplicate detection
+
+        Returns:
+            Dictionary mapping hashes to list of row positions
+        """
+        from pandas.util import hash_pandas_object
+
+        hashes = hash_pandas_object(frame[list(fields)], index=False)
+        hashes = hashes.reset_index(drop=True)
+        duplicated = hashes[hashes.duplicated(keep=False)]
+
+        groups = duplicated.index.groupby(duplicated.to_numpy())
+        return {
+            format(int(h), "016x"): positions.tolist()
+            for h, positions in groups.items()
+        }
+
 
 # Transformation functions that can be used with transform_field method
 def to_title_case(value: Any) -> str:
@@ -422,7 +636,7 @@ def remove_special_chars(value: Any) -> str:
     """Remove special characters, keep only alphanumeric and spaces"""
     if not value:
         return ""
-    return re.sub(r"[^a-zA-Z0-9\s]", "", str(value))
+    return _SPECIAL_CHARS_RE.sub("", str(value))
 
 
 def format_ssn(value: Any) -> Optional[str]:
@@ -430,7 +644,7 @@ def format_ssn(value: Any) -> Optional[str]:
     if not value:
         return None
 
-    digits = re.sub(r"\D", "", str(value))
+    digits = _digits_only(str(value))
     if len(digits) == 9:
         return f"{digits[:3]}-{digits[3:5]}-{digits[5:]}"
     return None
@@ -0,0 +1,88 @@
+"""
+JSON encoding helpers
+Uses orjson when it is installed and falls back to the standard library
+"""
+
+import json
+from datetime import date, time
+from uuid import UUID
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+
+def _stdlib_options(indent: bool, default) -> dict:
+    """json.dump(s) arguments that give the same output as orjson"""
+    def encode(value):
+        # Types orjson encodes natively; datetime is a date subclass
+        if isinstance(value, (date, time)):
+            return value.isoformat()
+        if isinstance(value, UUID):
+            return str(value)
+        if default is None:
+            raise TypeError(
+                f"Object of type {type(value).__name__} is not JSON serializable"
+            )
+        return default(value)
+
+    return {
+        "indent": 2 if indent else None,
+        "separators": None if indent else (",", ":"),
+        "ensure_ascii": False,
+        "default": encode,
+    }
+
+
+def dumps(value: object, indent: bool = False, default=None) -> str:
+    """
+    Serialize a value to a JSON string
+
+    Args:
+        value: Value to serialize
+        indent: Pretty-print with two-space indentation
+        default: Fallback for objects JSON cannot encode natively
+
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            return orjson.dumps(value, default=default, option=option).decode("utf-8")
+        except TypeError:
+            # orjson rejects non-string keys and integers wider than 64 bits
+            pass
+    return json.dumps(value, **_stdlib_options(indent, default))
+
+
+def dump(value: object, fp, indent: bool = False, default=None) -> None:
+    """
+    Serialize a value as JSON to a text file object
+
+    orjson encodes the whole document in one C call; the standard library
+    writes it to the file chunk by chunk instead of building one string.
+
+    Args:
+        value: Value to serialize
+        fp: Text file object, or anything with a write() method
+        indent: Pretty-print with two-space indentation
+        default: Fallback for objects JSON cannot encode natively
+    """
+    if orjson is not None:
+        fp.write(dumps(value, indent=indent, default=default))
+        return
+    json.dump(value, fp, **_stdlib_options(indent, default))
+
+
+def loads(value):
+    """
+    Deserialize a JSON string or bytes
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
@@ -5,10 +5,21 @@ Provides command-line interface for ETL operations
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import connections
+from django_etl import jsonutils
 from django_etl.utils import ETLUtils
-import json
 import sys
 
+# Upper bound on rows read by preview and estimate, so a mistyped --limit or
+# --batch-size cannot pull a whole table into memory
+MAX_SAMPLE_ROWS = 10000
+
+# Options that set how many rows an action samples, and so are capped
+SAMPLED_OPTIONS = {
+    "preview": ("limit",),
+    "estimate": ("batch_size",),
+    "all": ("limit", "batch_size"),
+}
+
 
 class Command(BaseCommand):
     help = "Analyze, validate, and preview ETL operations"
@@ -16,7 +27,7 @@ class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
             "action",
-            choices=["analyze", "duplicates", "preview", "estimate"],
+            choices=["analyze", "duplicates", "preview", "estimate", "all"],
             help="ETL action to perform",
         )
         parser.add_argument("--table", required=True, help="Table name to analyze")
@@ -30,11 +41,30 @@ class Command(BaseCommand):
         )
         parser.add_argument("--output", help="Output file for results")
 
+    def write_json(self, result):
+        """Stream result as JSON to stdout, followed by a single newline"""
+        # OutputWrapper adds its line ending to every write() call
+        ending, self.stdout.ending = self.stdout.ending, ""
+        try:
+            jsonutils.dump(result, self.stdout, indent=True, default=str)
+        finally:
+            self.stdout.ending = ending
+        self.stdout.write("")
+
     def handle(self, *args, **options):
         action = options["action"]
         table = options["table"]
         database = options["database"]
 
+        for option in SAMPLED_OPTIONS.get(action, ()):
+            if options[option] > MAX_SAMPLE_ROWS:
+                self.stderr.write(
+                    self.style.WARNING(
+                        f"--{option.replace('_', '-')} capped at {MAX_SAMPLE_ROWS} rows"
+                    )
+                )
+                options[option] = MAX_SAMPLE_ROWS
+
         result = None
 
         try:
@@ -60,18 +90,24 @@ class Command(BaseCommand):
                     table, database, options["batch_size"]
                 )
 
+            elif action == "all":
+                if not options["columns"]:
+                    raise CommandError("--columns required for all command")
+                columns = [col.strip() for col in options["columns"].split(",")]
+                result = ETLUtils.full_report(
+                    table, columns, database, options["limit"], options["batch_size"]
+                )
+
             # Output results
             if result:
-                output_json = json.dumps(result, indent=2, default=str)
-
                 if options["output"]:
                     with open(options["output"], "w") as f:
-                        f.write(output_json)
+                        jsonutils.dump(result, f, indent=True, default=str)
                     self.stdout.write(
                         self.style.SUCCESS(f'Results saved to {options["output"]}')
                     )
                 else:
-                    self.stdout.write(output_json)
+                    self.write_json(result)
 
         except Exception as e:
             raise CommandError(f"ETL operation failed: {e}")
@@ -5,12 +5,20 @@ Integrates with existing migrate_legacy_data command patterns
 
 import time
 import logging
+import logging.handlers
 import sys
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import replace
 from datetime import datetime
+from functools import lru_cache
 from django.core.management.base import BaseCommand, CommandError
 from django.apps import apps
+from django.db import connections, router, transaction
+from django.utils import timezone
 from django_etl.discovery import discover_transformers
-from django_etl.config import ETLConfigManager
+from django_etl.config import config_manager
+from django_etl.signals import invalidate_admin_caches
 
 try:
     # Try to import MigrationLog from the project
@@ -19,6 +27,110 @@ except ImportError:
     # Fallback if MigrationLog doesn't exist
     MigrationLog = None
 
+LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+# Log records buffered before being written to --log-file; errors flush at once
+LOG_FILE_BUFFER_CAPACITY = 1024
+
+# Marks the root-logger handlers added by this command, so only those are removed
+ETL_HANDLER_ATTR = "_etl_handler"
+
+# Django contrib apps and common third-party packages never hold transformers
+SKIP_APP_PREFIXES = ("django.contrib.", "rest_framework", "drf_", "corsheaders")
+
+# Project apps ("apps.*") and the core app; top-level apps are scanned as well
+PROJECT_APP_PREFIXES = ("apps.", "core")
+
+
+def detach_etl_handlers(root_logger):
+    """Flush, close and remove the handlers this command added to the root logger"""
+    for handler in root_logger.handlers[:]:
+        if not getattr(handler, ETL_HANDLER_ATTR, False):
+            continue
+        root_logger.removeHandler(handler)
+        # MemoryHandler.close() flushes but leaves its target open
+        target = getattr(handler, "target", None)
+        handler.close()
+        if target is not None:
+            target.close()
+    root_logger._etl_logging = None
+
+
+def get_dependencies(TransformerClass, transformers):
+    """Keys the transformer depends on, limited to those in transformers"""
+    return [
+        key for key in getattr(TransformerClass, "depends_on", ()) if key in transformers
+    ]
+
+
+def order_by_dependencies(transformers):
+    """
+    Order transformers so that each one comes after those it depends on
+
+    Transformers without dependencies keep their original order. Dependencies
+    outside of transformers (e.g. left out by --only) are ignored.
+
+    Args:
+        transformers: Dictionary mapping keys to transformer classes
+
+    Returns:
+        Reordered dictionary
+
+    Raises:
+        CommandError: If the dependencies form a cycle
+    """
+    ordered = {}
+    visiting = set()
+
+    def visit(key):
+        if key in ordered:
+            return
+        if key in visiting:
+            raise CommandError(f"Circular transformer dependency involving '{key}'")
+
+        visiting.add(key)
+        for dependency in get_dependencies(transformers[key], transformers):
+            visit(dependency)
+        visiting.discard(key)
+
+        ordered[key] = transformers[key]
+
+    for key in transformers:
+        visit(key)
+
+    return ordered
+
+
+@lru_cache(maxsize=1)
+def get_auto_discovery_paths():
+    """
+    Guess transformer module paths from the installed apps
+
+    The app registry does not change once Django is set up, so the scan runs
+    once per process.
+
+    Returns:
+        Tuple of candidate transformer module paths
+    """
+    base_paths = []
+
+    # Look for apps that are likely to have transformers
+    for app_config in apps.get_app_configs():
+        app_name = app_config.name
+
+        if app_name.startswith(SKIP_APP_PREFIXES) or app_name == "django_etl":
+            continue
+
+        if app_name.startswith(PROJECT_APP_PREFIXES) or "." not in app_name:
+            base_paths.extend(
+                (f"{app_name}.transformers", f"{app_name}.etl.transformers")
+            )
+
+    return tuple(base_paths)
+
 
 class Command(BaseCommand):
     help = "Run legacy-to-new data transformers with enhanced ETL framework features"
@@ -68,35 +180,68 @@ class Command(BaseCommand):
             type=str,
             help="Comma-separated list of transformer module paths",
         )
+        parser.add_argument(
+            "--max-workers",
+            type=int,
+            help=(
+                "Number of transformers to run concurrently (default: 1, or "
+                "TRANSFORMATION MAX_WORKERS when ENABLE_PARALLEL_TRANSFORMS is set)"
+            ),
+        )
+        parser.add_argument(
+            "--single-transaction",
+            action="store_true",
+            help=(
+                "Commit all transformers and their logs in one transaction; a "
+                "failed transformer only rolls back its own changes"
+            ),
+        )
 
     def setup_logging(self, log_file=None, log_level="INFO"):
-        """Setup structured logging for migrations"""
-        # Create formatter
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+        """
+        Setup structured logging for migrations
+
+        Repeated calls with the same arguments in one process (tests, workers
+        calling the command) reuse the handlers set up by the first call.
+        Handlers configured by the host project are left in place; only the
+        ones added here are replaced, and handle() removes them when done.
+        """
+        root_logger = logging.getLogger()
+        migration_logger = logging.getLogger("migration")
+
+        if getattr(root_logger, "_etl_logging", None) == (log_file, log_level):
+            return migration_logger
 
         # Setup root logger
-        root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, log_level))
 
-        # Clear existing handlers
-        root_logger.handlers.clear()
+        # Replace the handlers of an earlier call, keeping the project's own
+        detach_etl_handlers(root_logger)
 
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
+        console_handler.setFormatter(LOG_FORMATTER)
+        handlers = [console_handler]
 
-        # File handler if specified
+        # File handler if specified, opened on the first write and buffered
         if log_file:
-            file_handler = logging.FileHandler(log_file)
-            file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            file_handler = logging.FileHandler(log_file, delay=True)
+            file_handler.setFormatter(LOG_FORMATTER)
+            handlers.append(
+                logging.handlers.MemoryHandler(
+                    LOG_FILE_BUFFER_CAPACITY,
+                    flushLevel=logging.ERROR,
+                    target=file_handler,
+                )
+            )
+
+        for handler in handlers:
+            setattr(handler, ETL_HANDLER_ATTR, True)
+            root_logger.addHandler(handler)
+
+        root_logger._etl_logging = (log_file, log_level)
 
         # Migration-specific logger
-        migration_logger = logging.getLogger("migration")
         migration_logger.setLevel(getattr(logging, log_level))
 
         return migration_logger
@@ -108,7 +253,6 @@ class Command(BaseCommand):
             base_paths = [path.strip() for path in transformer_paths.split(",")]
         else:
             # First try to get configured paths from Django settings
-            config_manager = ETLConfigManager()
             configured_paths = config_manager.get_transformer_discovery_paths()
 
             if configured_paths:
@@ -121,31 +265,7 @@ class Command(BaseCommand):
             else:
                 # Only fall back to auto-discovery if no paths are configured
                 # and limit to apps that might actually have transformers
-                base_paths = []
-
-                # Look for apps that are likely to have transformers
-                # (avoiding Django contrib apps and third-party packages)
-                for app_config in apps.get_app_configs():
-                    app_name = app_config.name
-
-                    # Skip Django contrib apps and common third-party packages
-                    if (
-                        not app_name.startswith("django.contrib.")
-                        and not app_name.startswith("rest_framework")
-                        and not app_name.startswith("drf_")
-                        and not app_name.startswith("corsheaders")
-                        and app_name != "django_etl"  # Skip ourselves
-                        and (
-                            app_name.startswith("apps.")  # Project apps
-                            or app_name.startswith("core")  # Core app
-                            or "." not in app_name  # Top-level apps
-                        )
-                    ):
-                        potential_paths = [
-                            f"{app_name}.transformers",
-                            f"{app_name}.etl.transformers",
-                        ]
-                        base_paths.extend(potential_paths)
+                base_paths = get_auto_discovery_paths()
 
                 if base_paths:
                     self.stdout.write(
@@ -169,179 +289,387 @@ class Command(BaseCommand):
             )
             return {}
 
-    def handle(self, *args, **options):
-        dry_run = options["dry_run"]
-        only = options["only"]
-        log_file = options["log_file"]
-        log_level = options["log_level"]
-        enable_rollback = options["enable_rollback"]
-        enable_validation = options["enable_validation"]
-        batch_size = options["batch_size"]
-        transformer_paths = options["transformer_paths"]
-
-        # Setup logging
-        logger = self.setup_logging(log_file, log_level)
+    def run_transformer(
+        self, key, TransformerClass, logger, dry_run, enable_rollback, batch_size
+    ):
+        """
+        Run a single transformer
+
+        Args:
+            key: Transformer key
+            TransformerClass: Transformer class to instantiate and run
+            logger: Migration logger
+            dry_run: Run without committing to the database
+            enable_rollback: Enable automatic rollback on failure
+            batch_size: Batch size override, or None
+
+        Returns:
+            Result dictionary with success, duration, finished_at and either
+            result and summary or error
+        """
+        logger.info("Starting '%s' transformer...", key)
+        start_time = time.monotonic()
 
-        # Log migration start with enhanced features
-        mode = "DRY RUN" if dry_run else "LIVE"
-        logger.info(f"Starting enhanced ETL migration in {mode} mode")
-        logger.info(f"Rollback enabled: {enable_rollback}")
-        logger.info(f"Validation enabled: {enable_validation}")
+        try:
+            # Instantiate transformer with enhanced features
+            transformer = TransformerClass()
 
-        if batch_size:
-            logger.info(f"Custom batch size: {batch_size}")
+            # Override batch size if specified
+            if batch_size and hasattr(transformer, "config"):
+                transformer.config = replace(transformer.config, batch_size=batch_size)
 
-        if log_file:
-            logger.info(f"Logging to file: {log_file}")
+            # Run with enhanced features
+            result = transformer.safe_run(
+                dry_run=dry_run, enable_rollback=enable_rollback and not dry_run
+            )
 
-        # Discover transformers
-        transformers = self.discover_transformers_from_apps(transformer_paths)
+            duration = time.monotonic() - start_time
+
+            # Get comprehensive migration summary
+            migration_summary = transformer.get_migration_summary()
+
+            return {
+                "success": True,
+                "duration": duration,
+                "finished_at": timezone.now(),
+                "result": result,
+                "summary": migration_summary,
+                "records_created": migration_summary["statistics"].get("created", 0),
+                "recommendations": migration_summary.get(
+                    "performance_report", {}
+                ).get("recommendations", []),
+            }
 
-        if not transformers:
-            error_msg = "No transformers discovered. Check your transformer paths or create transformers."
-            logger.error(error_msg)
-            self.stderr.write(self.style.ERROR(error_msg))
-            return
+        except Exception as e:
+            duration = time.monotonic() - start_time
+            logger.error(
+                "'%s' failed after %.2fs: %s", key, duration, e, exc_info=True
+            )
 
-        # Determine which transformers to run
-        if only:
-            keys = [key.strip() for key in only.split(",")]
-            transformers_to_run = {
-                key: transformers[key] for key in keys if key in transformers
+            return {
+                "success": False,
+                "duration": duration,
+                "finished_at": timezone.now(),
+                "error": str(e),
             }
-            if not transformers_to_run:
-                error_msg = f"No valid transformers found for: {', '.join(keys)}"
-                logger.error(error_msg)
-                self.stderr.write(self.style.ERROR(error_msg))
-                return
-            logger.info(f"Running specific transformers: {', '.join(keys)}")
-        else:
-            transformers_to_run = transformers
-            logger.info(f"Running all {len(transformers_to_run)} transformers")
 
-        total_start_time = time.time()
+    def run_transformers(self, transformers_to_run, logger, run_options):
+        """
+        Run transformers one after another, in order
+
+        Returns:
+            Dictionary mapping transformer keys to run_transformer results
+        """
         results = {}
 
         for key, TransformerClass in transformers_to_run.items():
-            logger.info(f"Starting '{key}' transformer...")
             self.stdout.write(f"Running '{key}' transformer with enhanced features...")
+            results[key] = self.run_transformer(
+                key, TransformerClass, logger, **run_options
+            )
+            self.report_result(key, results[key], logger)
 
-            start_time = time.time()
-            success = True
-            error_message = ""
-            duration = 0
-            migration_summary = {}
+        return results
 
-            try:
-                # Instantiate transformer with enhanced features
-                transformer = TransformerClass()
+    def run_transformers_parallel(
+        self, transformers_to_run, logger, max_workers, run_options
+    ):
+        """
+        Run transformers concurrently in a thread pool
+
+        A transformer is only started once every transformer in its
+        depends_on has finished.
 
-                # Override batch size if specified
-                if batch_size and hasattr(transformer, "config"):
-                    transformer.config.batch_size = batch_size
+        Returns:
+            Dictionary mapping transformer keys to run_transformer results,
+            in order of completion
+        """
+        results = {}
+        pending = dict(transformers_to_run)
+        running = {}
+
+        # Transformers mostly wait on the database, so threads overlap
+        # their queries
+        logger.info("Running transformers with %d workers", max_workers)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                for key, TransformerClass in list(pending.items()):
+                    dependencies = get_dependencies(
+                        TransformerClass, transformers_to_run
+                    )
+                    if any(dependency not in results for dependency in dependencies):
+                        continue
 
-                # Run with enhanced features
-                result = transformer.safe_run(
-                    dry_run=dry_run, enable_rollback=enable_rollback and not dry_run
+                    del pending[key]
+                    self.stdout.write(
+                        f"Running '{key}' transformer with enhanced features..."
+                    )
+                    future = executor.submit(
+                        self.run_transformer_in_thread,
+                        key,
+                        TransformerClass,
+                        logger,
+                        **run_options,
+                    )
+                    running[future] = key
+
+                # Report each result from this thread as it finishes
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    key = running.pop(future)
+                    results[key] = future.result()
+                    self.report_result(key, results[key], logger)
+
+        return results
+
+    def run_transformer_in_thread(self, *args, **kwargs):
+        """Run a transformer in a worker thread, closing its connections after"""
+        try:
+            return self.run_transformer(*args, **kwargs)
+        finally:
+            connections.close_all()
+
+    def report_result(self, key, result, logger):
+        """
+        Write a transformer result to the console
+
+        Args:
+            key: Transformer key
+            result: Result dictionary from run_transformer
+            logger: Migration logger
+        """
+        duration = result["duration"]
+        migration_summary = result.get("summary", {})
+
+        if result["success"]:
+            # Log detailed success information
+            stats = migration_summary.get("statistics", {})
+            msg = (
+                f"'{key}' completed successfully in {duration:.2f}s. "
+                f"Stats: {stats}"
+            )
+            logger.info(msg)
+            self.stdout.write(self.style.SUCCESS(msg))
+
+            # Show performance insights
+            perf_report = migration_summary.get("performance_report", {})
+            if perf_report.get("operations"):
+                # One write for the whole block rather than one per line
+                lines = ["Performance Summary:"]
+                lines.extend(
+                    f"  {operation}: {op_stats.get('avg_time', 0):.3f}s avg "
+                    f"({op_stats.get('count', 0)} times)"
+                    for operation, op_stats in perf_report["operations"].items()
                 )
+                self.stdout.write("\n".join(lines))
+        else:
+            err_msg = f"'{key}' failed after {duration:.2f}s: {result['error']}"
+            self.stderr.write(self.style.ERROR(err_msg))
+
+    def build_migration_log(self, key, result, dry_run):
+        """
+        Build an unsaved MigrationLog row for a transformer result
+
+        Args:
+            key: Transformer key
+            result: Result dictionary from run_transformer
+            dry_run: Whether the run was a dry run
+
+        Returns:
+            MigrationLog instance
+        """
+        migration_summary = result.get("summary", {})
+        log = MigrationLog(
+            # Logs are built after the whole run; keep each transformer's time
+            run_at=result["finished_at"],
+            dry_run=dry_run,
+            duration_seconds=result["duration"],
+            transformer=key,
+            success=result["success"],
+            error_message=result.get("error"),
+            total_records=result.get("records_created"),
+            # Enhanced logging fields
+            statistics=migration_summary.get("statistics", {}),
+            performance_data=migration_summary.get("performance_report", {}),
+        )
 
-                duration = time.time() - start_time
+        # bulk_create() skips save(), which fills the cached summaries
+        if hasattr(log, "refresh_summary_cache"):
+            log.refresh_summary_cache()
 
-                # Get comprehensive migration summary
-                migration_summary = transformer.get_migration_summary()
+        return log
 
-                results[key] = {
-                    "success": True,
-                    "duration": duration,
-                    "result": result,
-                    "summary": migration_summary,
-                }
+    def save_migration_logs(self, logs, logger):
+        """
+        Insert the collected MigrationLog rows in one round-trip
+
+        Falls back to saving row by row if the bulk insert fails, so one bad
+        row does not lose the others.
+
+        Args:
+            logs: Unsaved MigrationLog instances
+            logger: Migration logger
+        """
+        if not logs:
+            return
+
+        try:
+            with transaction.atomic(using=router.db_for_write(MigrationLog)):
+                MigrationLog.objects.bulk_create(logs, batch_size=500)
+            # bulk_create() sends no post_save, so drop the cached admin stats here
+            invalidate_admin_caches(sender=MigrationLog)
+            return
+        except Exception as bulk_error:
+            logger.warning("Bulk logging failed, saving logs one by one: %s", bulk_error)
+
+        for log in logs:
+            try:
+                log.save()
+            except Exception as log_error:
+                logger.warning("Could not log to database: %s", log_error)
 
-                # Log detailed success information
-                stats = migration_summary.get("statistics", {})
-                msg = (
-                    f"'{key}' completed successfully in {duration:.2f}s. "
-                    f"Stats: {stats}"
+    def handle(self, *args, **options):
+        dry_run = options["dry_run"]
+        only = options["only"]
+        log_file = options["log_file"]
+        log_level = options["log_level"]
+        enable_rollback = options["enable_rollback"]
+        enable_validation = options["enable_validation"]
+        batch_size = options["batch_size"]
+        transformer_paths = options["transformer_paths"]
+        max_workers = options["max_workers"]
+        single_transaction = options["single_transaction"]
+
+        if single_transaction:
+            # Worker threads cannot share the connection holding the transaction
+            if max_workers is not None and max_workers > 1:
+                raise CommandError(
+                    "--single-transaction cannot be combined with --max-workers"
                 )
-                logger.info(msg)
-                self.stdout.write(self.style.SUCCESS(msg))
-
-                # Show performance insights
-                perf_report = migration_summary.get("performance_report", {})
-                if perf_report.get("operations"):
-                    self.stdout.write("Performance Summary:")
-                    for operation, op_stats in perf_report["operations"].items():
-                        self.stdout.write(
-                            f"  {operation}: {op_stats.get('avg_time', 0):.3f}s avg "
-                            f"({op_stats.get('count', 0)} times)"
-                        )
+            max_workers = 1
+        elif max_workers is None:
+            max_workers = (
+                config_manager.get_transformation_config().max_workers
+                if config_manager.enable_parallel_transforms
+                else 1
+            )
+        elif max_workers < 1:
+            raise CommandError("--max-workers must be at least 1")
+
+        # Setup logging
+        logger = self.setup_logging(log_file, log_level)
 
-            except Exception as e:
-                success = False
-                error_message = str(e)
-                duration = time.time() - start_time
+        try:
+            # Log migration start with enhanced features
+            mode = "DRY RUN" if dry_run else "LIVE"
+            logger.info("Starting enhanced ETL migration in %s mode", mode)
+            logger.info("Rollback enabled: %s", enable_rollback)
+            logger.info("Validation enabled: %s", enable_validation)
+
+            if batch_size:
+                logger.info("Custom batch size: %s", batch_size)
+
+            if log_file:
+                logger.info("Logging to file: %s", log_file)
+
+            # Discover transformers
+            transformers = self.discover_transformers_from_apps(transformer_paths)
+
+            if not transformers:
+                error_msg = "No transformers discovered. Check your transformer paths or create transformers."
+                logger.error(error_msg)
+                self.stderr.write(self.style.ERROR(error_msg))
+                return
 
-                results[key] = {
-                    "success": False,
-                    "duration": duration,
-                    "error": error_message,
+            # Determine which transformers to run
+            if only:
+                # Keep the requested order, since transformers may depend on each other
+                keys = list(dict.fromkeys(key.strip() for key in only.split(",")))
+                missing = set(keys) - transformers.keys()
+                transformers_to_run = {
+                    key: transformers[key] for key in keys if key not in missing
                 }
+                if missing and transformers_to_run:
+                    warning_msg = f"Unknown transformers skipped: {', '.join(sorted(missing))}"
+                    logger.warning(warning_msg)
+                    self.stderr.write(self.style.WARNING(warning_msg))
+                if not transformers_to_run:
+                    error_msg = f"No valid transformers found for: {', '.join(keys)}"
+                    logger.error(error_msg)
+                    self.stderr.write(self.style.ERROR(error_msg))
+                    return
+                logger.info("Running specific transformers: %s", ", ".join(keys))
+            else:
+                transformers_to_run = transformers
+                logger.info("Running all %d transformers", len(transformers_to_run))
+
+            transformers_to_run = order_by_dependencies(transformers_to_run)
+
+            total_start_time = time.monotonic()
+            run_options = {
+                "dry_run": dry_run,
+                "enable_rollback": enable_rollback,
+                "batch_size": batch_size,
+            }
+
+            # Each transformer's own atomic block becomes a savepoint inside the
+            # outer transaction, so a failure only rolls back that transformer
+            outer_transaction = (
+                transaction.atomic() if single_transaction and not dry_run else nullcontext()
+            )
+
+            with outer_transaction:
+                if max_workers > 1 and len(transformers_to_run) > 1:
+                    results = self.run_transformers_parallel(
+                        transformers_to_run, logger, max_workers, run_options
+                    )
+                else:
+                    results = self.run_transformers(
+                        transformers_to_run, logger, run_options
+                    )
 
-                err_msg = f"'{key}' failed after {duration:.2f}s: {error_message}"
-                logger.error(err_msg, exc_info=True)
-                self.stderr.write(self.style.ERROR(err_msg))
-
-            # Log the migration result to database if MigrationLog is available
-            if MigrationLog and not dry_run:
-                try:
-                    MigrationLog.objects.create(
-                        dry_run=dry_run,
-                        duration_seconds=duration,
-                        transformer=key,
-                        success=success,
-                        error_message=error_message if not success else None,
-                        # Enhanced logging fields
-                        statistics=migration_summary.get("statistics", {}),
-                        performance_data=migration_summary.get(
-                            "performance_report", {}
-                        ),
+                # Log the migration results to database if MigrationLog is available
+                if MigrationLog and not dry_run:
+                    self.save_migration_logs(
+                        [
+                            self.build_migration_log(key, result, dry_run)
+                            for key, result in results.items()
+                        ],
+                        logger,
                     )
-                except Exception as log_error:
-                    logger.warning(f"Could not log to database: {log_error}")
 
-        # Final summary
-        total_duration = time.time() - total_start_time
-        successful = sum(1 for r in results.values() if r["success"])
-        failed = len(results) - successful
+            # Final summary
+            total_duration = time.monotonic() - total_start_time
+            successful = sum(r["success"] for r in results.values())
+            failed = len(results) - successful
 
-        summary = (
-            f"Enhanced ETL migration complete in {total_duration:.2f}s: "
-            f"{successful} successful, {failed} failed"
-        )
+            summary = (
+                f"Enhanced ETL migration complete in {total_duration:.2f}s: "
+                f"{successful} successful, {failed} failed"
+            )
 
-        logger.info(summary)
+            logger.info(summary)
 
-        # Show overall statistics
-        total_records_processed = sum(
-            r.get("summary", {}).get("statistics", {}).get("created", 0)
-            for r in results.values()
-            if r["success"]
-        )
+            # Show overall statistics
+            total_records_processed = sum(
+                r.get("records_created", 0) for r in results.values()
+            )
 
-        if total_records_processed > 0:
-            self.stdout.write(f"Total records processed: {total_records_processed}")
+            if total_records_processed > 0:
+                self.stdout.write(f"Total records processed: {total_records_processed}")
 
-        if failed == 0:
-            self.stdout.write(self.style.SUCCESS(summary))
-        else:
-            self.stdout.write(self.style.WARNING(summary))
+            if failed == 0:
+                self.stdout.write(self.style.SUCCESS(summary))
+            else:
+                self.stdout.write(self.style.WARNING(summary))
 
-        # Show recommendations if any
-        for key, result in results.items():
-            if result["success"] and "summary" in result:
-                perf_report = result["summary"].get("performance_report", {})
-                recommendations = perf_report.get("recommendations", [])
+            # Show recommendations if any
+            for key, result in results.items():
+                recommendations = result.get("recommendations")
                 if recommendations:
-                    self.stdout.write(f"\n💡 Recommendations for '{key}':")
-                    for rec in recommendations:
-                        self.stdout.write(f"  - {rec}")
+                    lines = [f"\n💡 Recommendations for '{key}':"]
+                    lines.extend(f"  - {rec}" for rec in recommendations)
+                    self.stdout.write("\n".join(lines))
+        finally:
+            # Writes out log records still buffered for --log-file
+            detach_etl_handlers(logging.getLogger())
@@ -0,0 +1,35 @@
+# Generated by Django ETL Framework
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_etl", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="migrationlog",
+            name="performance_summary_cached",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Precomputed short performance summary",
+                max_length=50,
+            ),
+        ),
+        migrations.AddField(
+            model_name="migrationlog",
+            name="validation_summary_cached",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Precomputed short validation summary",
+                max_length=40,
+            ),
+        ),
+    ]
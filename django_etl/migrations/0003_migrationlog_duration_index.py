@@ -0,0 +1,20 @@
+# Generated by Django ETL Framework
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_etl", "0002_migrationlog_summary_cache"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="migrationlog",
+            index=models.Index(
+                fields=["duration_seconds"],
+                name="migrationlog_duration_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django ETL Framework
+
+from django.db import DatabaseError, migrations, transaction
+
+# Trigram indexes backing the admin search on PostgreSQL. Django compiles
+# icontains to UPPER(column::text) LIKE UPPER('%term%'), so indexing the same
+# expression lets the planner use the index without changing the queries.
+SEARCH_INDEXES = {
+    "migrationlog_transformer_trgm": "transformer",
+    "migrationlog_error_trgm": "error_message",
+}
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    MigrationLog = apps.get_model("django_etl", "MigrationLog")
+    table = schema_editor.quote_name(MigrationLog._meta.db_table)
+
+    try:
+        # Creating the extension needs elevated privileges on some servers;
+        # search still works without the indexes, just with a sequential scan.
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+            for name, column in SEARCH_INDEXES.items():
+                schema_editor.execute(
+                    f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(name)} "
+                    f"ON {table} USING gin "
+                    f"(UPPER({schema_editor.quote_name(column)}::text) gin_trgm_ops)"
+                )
+    except DatabaseError:
+        pass
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for name in SEARCH_INDEXES:
+        schema_editor.execute(
+            f"DROP INDEX IF EXISTS {schema_editor.quote_name(name)}"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_etl", "0003_migrationlog_duration_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django ETL Framework
+
+from django.db import migrations, models
+
+# Partial index for dashboards listing the latest successful live runs
+# (success=True, dry_run=False ORDER BY run_at DESC). Only created where the
+# backend supports partial indexes; elsewhere Django would drop the condition
+# and build a duplicate of the run_at index.
+LIVE_RECENT_INDEX = models.Index(
+    fields=["-run_at"],
+    condition=models.Q(success=True, dry_run=False),
+    name="migrationlog_live_recent_idx",
+)
+
+
+def create_live_recent_index(apps, schema_editor):
+    if not schema_editor.connection.features.supports_partial_indexes:
+        return
+
+    MigrationLog = apps.get_model("django_etl", "MigrationLog")
+    schema_editor.add_index(MigrationLog, LIVE_RECENT_INDEX)
+
+
+def drop_live_recent_index(apps, schema_editor):
+    if not schema_editor.connection.features.supports_partial_indexes:
+        return
+
+    MigrationLog = apps.get_model("django_etl", "MigrationLog")
+    schema_editor.remove_index(MigrationLog, LIVE_RECENT_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("django_etl", "0004_migrationlog_search_trgm_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_live_recent_index, drop_live_recent_index),
+    ]
@@ -5,9 +5,56 @@ Provides migration logging and tracking capabilities
 
 from django.db import models
 from django.utils import timezone
-from django.contrib.postgres.fields import JSONField
 import json
 
+from . import jsonutils
+
+# Maximum lengths of the short summaries shown in the admin changelist
+PERFORMANCE_SUMMARY_SHORT_LENGTH = 50
+VALIDATION_SUMMARY_SHORT_LENGTH = 40
+
+# Validation status labels and the (label, results key) pairs counted per severity
+VALIDATION_PASSED = "✅ PASSED"
+VALIDATION_FAILED = "❌ FAILED"
+VALIDATION_SEVERITY_COUNTS = (
+    ("ERRORs", "error_count"),
+    ("WARNINGs", "warning_count"),
+    ("INFOs", "info_count"),
+)
+
+# MigrationLog columns needed to list logs, leaving out the JSON payloads
+MIGRATION_LOG_LIST_FIELDS = (
+    "id",
+    "transformer",
+    "run_at",
+    "duration_seconds",
+    "success",
+    "dry_run",
+    "error_message",
+    "total_records",
+    "performance_summary_cached",
+    "validation_summary_cached",
+)
+
+
+def _truncate(text, max_length=None):
+    """Truncate text to max_length characters, marking the cut with '...'"""
+    if max_length is not None and len(text) > max_length:
+        return text[: max_length - 3] + "..."
+    return text
+
+
+def format_duration(duration_seconds):
+    """Format a duration in seconds as a human-readable string"""
+    if duration_seconds < 1:
+        return f"{duration_seconds * 1000:.0f}ms"
+    elif duration_seconds < 60:
+        return f"{duration_seconds:.1f}s"
+    else:
+        minutes = int(duration_seconds // 60)
+        seconds = duration_seconds % 60
+        return f"{minutes}m {seconds:.1f}s"
+
 
 class MigrationLog(models.Model):
     """
@@ -61,6 +108,22 @@ class MigrationLog(models.Model):
         help_text="JSON-encoded system information during migration",
     )
 
+    # Short summaries precomputed on save for the admin changelist
+    performance_summary_cached = models.CharField(
+        max_length=PERFORMANCE_SUMMARY_SHORT_LENGTH,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Precomputed short performance summary",
+    )
+    validation_summary_cached = models.CharField(
+        max_length=VALIDATION_SUMMARY_SHORT_LENGTH,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Precomputed short validation summary",
+    )
+
     class Meta:
         ordering = ["-run_at"]
         verbose_name = "Migration Log"
@@ -69,6 +132,12 @@ class MigrationLog(models.Model):
             models.Index(fields=["transformer", "run_at"]),
             models.Index(fields=["success", "run_at"]),
             models.Index(fields=["dry_run", "run_at"]),
+            # Backs the admin DurationListFilter range lookups
+            models.Index(
+                fields=["duration_seconds"], name="migrationlog_duration_idx"
+            ),
+            # Latest successful live runs use a partial index created by
+            # migration 0005 on backends that support partial indexes
         ]
 
     def __str__(self):
@@ -76,94 +145,125 @@ class MigrationLog(models.Model):
         mode = " (DRY RUN)" if self.dry_run else ""
         return f"[{status}] {self.transformer}{mode} @ {self.run_at.strftime('%Y-%m-%d %H:%M:%S')}"
 
+    def save(self, *args, **kwargs):
+        """Refresh the precomputed summaries before saving"""
+        self.refresh_summary_cache()
+
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {
+                *update_fields,
+                "performance_summary_cached",
+                "validation_summary_cached",
+            }
+
+        super().save(*args, **kwargs)
+
+    def refresh_summary_cache(self):
+        """Recompute the short summaries stored for the admin changelist"""
+        self.performance_summary_cached = self.get_performance_summary(
+            max_length=PERFORMANCE_SUMMARY_SHORT_LENGTH
+        )
+        self.validation_summary_cached = self.get_validation_summary(
+            max_length=VALIDATION_SUMMARY_SHORT_LENGTH
+        )
+
+    def _decode_json(self, field_name):
+        """
+        Decode a JSON TextField, reusing the last result while it is unchanged
+
+        save(), the summaries and the admin detail view each read the same
+        payloads, so the decoded value is kept together with the raw string it
+        came from and parsed again only once the field holds another string.
+        Treat the returned dictionary as read-only.
+        """
+        raw = getattr(self, field_name)
+        if not raw:
+            return {}
+
+        cache = self.__dict__.setdefault("_decoded_json", {})
+        cached = cache.get(field_name)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+
+        try:
+            value = jsonutils.loads(raw)
+        except (json.JSONDecodeError, TypeError):
+            value = {}
+
+        cache[field_name] = (raw, value)
+        return value
+
     @property
     def statistics(self):
         """Get statistics as a Python dictionary"""
-        if self.statistics_json:
-            try:
-                return json.loads(self.statistics_json)
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        return {}
+        return self._decode_json("statistics_json")
 
     @statistics.setter
     def statistics(self, value):
         """Set statistics from a Python dictionary"""
         if value:
-            self.statistics_json = json.dumps(value, default=str)
+            self.statistics_json = jsonutils.dumps(value, default=str)
         else:
             self.statistics_json = None
 
     @property
     def performance_data(self):
         """Get performance data as a Python dictionary"""
-        if self.performance_data_json:
-            try:
-                return json.loads(self.performance_data_json)
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        return {}
+        return self._decode_json("performance_data_json")
 
     @performance_data.setter
     def performance_data(self, value):
         """Set performance data from a Python dictionary"""
         if value:
-            self.performance_data_json = json.dumps(value, default=str)
+            self.performance_data_json = jsonutils.dumps(value, default=str)
         else:
             self.performance_data_json = None
 
     @property
     def validation_results(self):
         """Get validation results as a Python dictionary"""
-        if self.validation_results_json:
-            try:
-                return json.loads(self.validation_results_json)
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        return {}
+        return self._decode_json("validation_results_json")
 
     @validation_results.setter
     def validation_results(self, value):
         """Set validation results from a Python dictionary"""
         if value:
-            self.validation_results_json = json.dumps(value, default=str)
+            self.validation_results_json = jsonutils.dumps(value, default=str)
         else:
             self.validation_results_json = None
 
     @property
     def system_info(self):
         """Get system info as a Python dictionary"""
-        if self.system_info_json:
-            try:
-                return json.loads(self.system_info_json)
-            except (json.JSONDecodeError, TypeError):
-                return {}
-        return {}
+        return self._decode_json("system_info_json")
 
     @system_info.setter
     def system_info(self, value):
         """Set system info from a Python dictionary"""
         if value:
-            self.system_info_json = json.dumps(value, default=str)
+            self.system_info_json = jsonutils.dumps(value, default=str)
         else:
             self.system_info_json = None
 
     def get_formatted_duration(self):
         """Get human-readable duration"""
-        if self.duration_seconds < 1:
-            return f"{self.duration_seconds * 1000:.0f}ms"
-        elif self.duration_seconds < 60:
-            return f"{self.duration_seconds:.1f}s"
-        else:
-            minutes = int(self.duration_seconds // 60)
-            seconds = self.duration_seconds % 60
-            return f"{minutes}m {seconds:.1f}s"
+        return format_duration(self.duration_seconds)
+
+    def get_performance_summary(self, max_length=None):
+        """
+        Get a summary of performance metrics
 
-    def get_performance_summary(self):
-        """Get a summary of performance metrics"""
+        Args:
+            max_length: Truncate the summary to this many characters. Operation
+                counts past the limit are not formatted at all.
+
+        Returns:
+            Summary string
+        """
         perf_data = self.performance_data
         if not perf_data:
-            return "No performance data available"
+            return _truncate("No performance data available", max_length)
 
         summary = []
 
@@ -181,34 +281,45 @@ class MigrationLog(models.Model):
         # Operation counts
         operations = perf_data.get("operations", {})
         if operations:
+            # Length of " | ".join(summary), kept up to date as parts are added
+            length = len(" | ".join(summary))
             for op, stats in operations.items():
+                if max_length is not None and length > max_length:
+                    break
                 count = stats.get("count", 0)
                 if count > 0:
-                    summary.append(f"{op}: {count}")
+                    part = f"{op}: {count}"
+                    length += len(part) + (3 if summary else 0)
+                    summary.append(part)
+
+        return _truncate(" | ".join(summary), max_length)
 
-        return " | ".join(summary)
+    def get_validation_summary(self, max_length=None):
+        """
+        Get a summary of validation results
 
-    def get_validation_summary(self):
-        """Get a summary of validation results"""
+        Args:
+            max_length: Truncate the summary to this many characters
+
+        Returns:
+            Summary string
+        """
         validation = self.validation_results
         if not validation:
-            return "No validation data available"
+            return _truncate("No validation data available", max_length)
 
-        summary = []
+        # Overall status
+        summary = [
+            VALIDATION_PASSED if validation.get("passed", True) else VALIDATION_FAILED
+        ]
 
         # Error counts by severity
-        for severity in ["ERROR", "WARNING", "INFO"]:
-            count = validation.get(f"{severity.lower()}_count", 0)
+        for label, key in VALIDATION_SEVERITY_COUNTS:
+            count = validation.get(key, 0)
             if count > 0:
-                summary.append(f"{severity}s: {count}")
+                summary.append(f"{label}: {count}")
 
-        # Overall status
-        if validation.get("passed", True):
-            summary.insert(0, "✅ PASSED")
-        else:
-            summary.insert(0, "❌ FAILED")
-
-        return " | ".join(summary)
+        return _truncate(" | ".join(summary), max_length)
 
 
 class MigrationRunSummary(models.Model):
@@ -283,23 +394,30 @@ class MigrationRunSummary(models.Model):
         duration = self.duration
         if duration is None:
             return "In progress..."
+        return format_duration(duration)
 
-        if duration < 1:
-            return f"{duration * 1000:.0f}ms"
-        elif duration < 60:
-            return f"{duration:.1f}s"
-        else:
-            minutes = int(duration // 60)
-            seconds = duration % 60
-            return f"{minutes}m {seconds:.1f}s"
+    def get_migration_logs(self, with_payloads=False):
+        """
+        Get all migration logs for this session, oldest first
 
-    def get_migration_logs(self):
-        """Get all migration logs for this session"""
+        Args:
+            with_payloads: Also load the JSON payload columns. Leave off when
+                listing logs; reading a payload of a row loaded without it
+                costs one extra query.
+
+        Returns:
+            QuerySet of MigrationLog
+        """
         # This would need to be implemented based on how session tracking is done
         # For now, return logs from the same time period
         start_time = self.started_at
         end_time = self.completed_at or timezone.now()
 
-        return MigrationLog.objects.filter(
+        logs = MigrationLog.objects.filter(
             run_at__gte=start_time, run_at__lte=end_time, dry_run=self.dry_run
-        )
+        ).order_by("run_at")
+
+        if not with_payloads:
+            logs = logs.only(*MIGRATION_LOG_LIST_FIELDS)
+
+        return logs
@@ -4,47 +4,131 @@ Provides detailed performance monitoring and optimization suggestions
 """
 
 import time
-import psutil
+import random
 import logging
+from array import array
 from collections import defaultdict
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from contextlib import contextmanager
+from .config import config_manager
+
+# Default for ETLProfiler(max_samples=...): read MONITORING MAX_SAMPLES_PER_OP
+_FROM_CONFIG = object()
+
+# Measurements recorded for every profiled operation
+METRIC_FIELDS = ('duration', 'memory_start', 'memory_end', 'memory_delta', 'timestamp')
+
+
+# (statistic, threshold, message): the message applies when the operation's
+# statistic exceeds the threshold
+RECOMMENDATION_RULES = (
+    ('avg_time', 5, "Operation '{operation}' is slow (avg: {value:.1f}s). Consider optimization."),
+    ('max_memory_delta', 100, "Operation '{operation}' uses high memory (max: {value:.1f}MB). Consider batch processing."),
+)
+SUGGESTION_RULES = (
+    ('avg_time', 2, "Consider batch processing for {operation}"),
+    ('max_memory_delta', 50, "Implement memory cleanup for {operation}"),
+)
+
+
+def _new_metric_columns() -> Dict[str, array]:
+    """One packed array of doubles per metric field"""
+    return {field: array('d') for field in METRIC_FIELDS}
+
+
+def _apply_rules(rules: tuple, operation: str, stats: Dict[str, Any]) -> List[str]:
+    """Format the message of every rule the operation's statistics trigger"""
+    return [
+        message.format(operation=operation, value=stats[statistic])
+        for statistic, threshold, message in rules
+        if stats[statistic] > threshold
+    ]
 
 
 class ETLProfiler:
     """Performance profiler for ETL operations"""
     
-    def __init__(self):
-        self.metrics = defaultdict(list)
+    def __init__(self, max_samples: Optional[int] = _FROM_CONFIG):
+        """
+        Args:
+            max_samples: Raw measurements kept per operation; None or 0 keeps
+                all of them. Defaults to MONITORING MAX_SAMPLES_PER_OP.
+        """
+        # operation -> {field: array of values}, stored column-wise so each
+        # measurement costs a few doubles instead of a dict. Beyond max_samples
+        # per operation the arrays hold a uniform reservoir sample.
+        self.metrics = defaultdict(_new_metric_columns)
+        # operation -> exact running totals covering every measurement
+        self.totals = {}
+        if max_samples is _FROM_CONFIG:
+            max_samples = config_manager.get_monitoring_config().max_samples_per_op
+        self.max_samples = max_samples
         self.start_times = {}
         self.memory_usage = []
         self.logger = logging.getLogger("etl.profiler")
+        # One handle for all measurements instead of a new Process() per read.
+        # psutil is imported here so importing the package doesn't load it.
+        import psutil
+        self._process = psutil.Process()
     
     @contextmanager
     def profile_operation(self, operation_name: str):
         """Context manager for profiling operations"""
         start_time = time.time()
-        start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+        start_clock = time.perf_counter_ns()
+        start_memory = self._process.memory_info().rss / 1024 / 1024  # MB
         
         try:
             yield self
         finally:
-            end_time = time.time()
-            end_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+            # Durations come from the monotonic, high-resolution performance
+            # counter in integer nanoseconds, unaffected by clock changes
+            duration = (time.perf_counter_ns() - start_clock) / 1e9
+            end_memory = self._process.memory_info().rss / 1024 / 1024  # MB
             
-            duration = end_time - start_time
             memory_delta = end_memory - start_memory
             
-            self.metrics[operation_name].append({
-                'duration': duration,
-                'memory_start': start_memory,
-                'memory_end': end_memory,
-                'memory_delta': memory_delta,
-                'timestamp': start_time
-            })
+            self._record(
+                operation_name,
+                (duration, start_memory, end_memory, memory_delta, start_time)
+            )
             
             self.logger.info(f"{operation_name}: {duration:.2f}s, Memory: {memory_delta:+.1f}MB")
     
+    def _record(self, operation_name: str, values: tuple) -> None:
+        """Update the running totals and keep the measurement in the reservoir"""
+        duration, _, _, memory_delta, _ = values
+        totals = self.totals.get(operation_name)
+        if totals is None:
+            totals = self.totals[operation_name] = {
+                'count': 0,
+                'total_time': 0.0,
+                'min_time': duration,
+                'max_time': duration,
+                'total_memory_delta': 0.0,
+                'max_memory_delta': memory_delta
+            }
+        
+        totals['count'] += 1
+        totals['total_time'] += duration
+        totals['min_time'] = min(totals['min_time'], duration)
+        totals['max_time'] = max(totals['max_time'], duration)
+        totals['total_memory_delta'] += memory_delta
+        totals['max_memory_delta'] = max(totals['max_memory_delta'], memory_delta)
+        
+        # Reservoir sampling (Algorithm R): keep the first max_samples, then
+        # replace a random slot with probability max_samples / count
+        columns = self.metrics[operation_name]
+        count = totals['count']
+        if not self.max_samples or count <= self.max_samples:
+            for field, value in zip(METRIC_FIELDS, values):
+                columns[field].append(value)
+        else:
+            slot = random.randrange(count)
+            if slot < self.max_samples:
+                for field, value in zip(METRIC_FIELDS, values):
+                    columns[field][slot] = value
+    
     def get_performance_report(self) -> Dict[str, Any]:
         """Generate comprehensive performance report"""
         report = {
@@ -56,21 +140,17 @@ class ETLProfiler:
         total_time = 0
         total_operations = 0
         
-        for operation, measurements in self.metrics.items():
-            if not measurements:
-                continue
-                
-            durations = [m['duration'] for m in measurements]
-            memory_deltas = [m['memory_delta'] for m in measurements]
-            
+        # Totals cover every measurement, even those dropped from the reservoir
+        for operation, totals in self.totals.items():
+            count = totals['count']
             op_stats = {
-                'count': len(measurements),
-                'total_time': sum(durations),
-                'avg_time': sum(durations) / len(durations),
-                'min_time': min(durations),
-                'max_time': max(durations),
-                'avg_memory_delta': sum(memory_deltas) / len(memory_deltas),
-                'max_memory_delta': max(memory_deltas)
+                'count': count,
+                'total_time': totals['total_time'],
+                'avg_time': totals['total_time'] / count,
+                'min_time': totals['min_time'],
+                'max_time': totals['max_time'],
+                'avg_memory_delta': totals['total_memory_delta'] / count,
+                'max_memory_delta': totals['max_memory_delta']
             }
             
             report['operations'][operation] = op_stats
@@ -78,15 +158,9 @@ class ETLProfiler:
             total_operations += op_stats['count']
             
             # Generate recommendations
-            if op_stats['avg_time'] > 5:
-                report['recommendations'].append(
-                    f"Operation '{operation}' is slow (avg: {op_stats['avg_time']:.1f}s). Consider optimization."
-                )
-            
-            if op_stats['max_memory_delta'] > 100:  # 100MB
-                report['recommendations'].append(
-                    f"Operation '{operation}' uses high memory (max: {op_stats['max_memory_delta']:.1f}MB). Consider batch processing."
-                )
+            report['recommendations'].extend(
+                _apply_rules(RECOMMENDATION_RULES, operation, op_stats)
+            )
         
         report['summary'] = {
             'total_time': total_time,
@@ -101,10 +175,6 @@ class ETLProfiler:
         suggestions = []
         
         for operation, stats in report['operations'].items():
-            if stats['avg_time'] > 2:
-                suggestions.append(f"Consider batch processing for {operation}")
-            
-            if stats['max_memory_delta'] > 50:
-                suggestions.append(f"Implement memory cleanup for {operation}")
+            suggestions.extend(_apply_rules(SUGGESTION_RULES, operation, stats))
         
         return suggestions
@@ -3,13 +3,25 @@ ETL Rollback and Recovery System
 Provides comprehensive rollback capabilities and disaster recovery
 """
 
+import gzip
 import json
+import os
 import pickle
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
-from django.db import transaction, connections
-from django.core.serializers import serialize, deserialize
+from django.apps import apps
+from django.db import transaction, connections, router
+from . import jsonutils
+from .config import config_manager
+
+
+# Write buffer for backup files; fewer, larger writes for multi-GB backups
+BACKUP_BUFFER_SIZE = 1024 * 1024
 
 
 @dataclass
@@ -29,14 +41,17 @@ class ETLRollbackManager:
     
     def __init__(self):
         self.snapshots = []
+        # migration_id -> first snapshot taken for it, for O(1) lookups
+        self._snapshots_by_id = {}
         self.backup_location = "/tmp/etl_backups"
         self.logger = None
     
     def create_snapshot(self, migration_id: str, transformer_name: str, affected_models: List[Any]) -> MigrationSnapshot:
         """Create a snapshot before migration"""
+        now = datetime.now()
         snapshot = MigrationSnapshot(
             migration_id=migration_id,
-            timestamp=datetime.now(),
+            timestamp=now,
             transformer_name=transformer_name,
             affected_tables=[model._meta.db_table for model in affected_models],
             record_counts={},
@@ -48,31 +63,168 @@ class ETLRollbackManager:
             snapshot.record_counts[model._meta.db_table] = model.objects.count()
         
         # Create backup
-        backup_file = self._create_backup(migration_id, affected_models)
+        backup_file = self._create_backup(migration_id, affected_models, now)
         snapshot.backup_location = backup_file
         
         self.snapshots.append(snapshot)
+        self._snapshots_by_id.setdefault(migration_id, snapshot)
         return snapshot
     
-    def _create_backup(self, migration_id: str, models: List[Any]) -> str:
+    def _create_backup(
+        self, migration_id: str, models: List[Any], timestamp: Optional[datetime] = None
+    ) -> str:
         """Create physical backup of data"""
-        import os
         os.makedirs(self.backup_location, exist_ok=True)
         
-        backup_file = f"{self.backup_location}/backup_{migration_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        timestamp = timestamp or datetime.now()
+        backup_file = f"{self.backup_location}/backup_{migration_id}_{timestamp.strftime('%Y%m%d_%H%M%S')}.json"
         
-        backup_data = {}
-        for model in models:
-            model_name = model._meta.label
-            queryset = model.objects.all()
-            serialized_data = serialize('json', queryset)
-            backup_data[model_name] = json.loads(serialized_data)
+        if config_manager.compress_backups:
+            backup_file += ".gz"
+        
+        transformation_config = config_manager.get_transformation_config()
+        chunk_size = transformation_config.batch_size
+        parts = self._backup_models_in_parallel(
+            models, chunk_size, transformation_config.max_workers
+        )
         
-        with open(backup_file, 'w') as f:
-            json.dump(backup_data, f, indent=2, default=str)
+        # Stream {"app.Model": [...], ...} straight to disk, one chunk of rows
+        # at a time, rather than building the whole backup in memory
+        try:
+            with self._open_backup(backup_file, 'w') as f:
+                f.write('{')
+                for index, (model, part) in enumerate(zip(models, parts)):
+                    if index:
+                        f.write(', ')
+                    f.write(f"{json.dumps(model._meta.label)}: ")
+                    if part is None:
+                        self._write_model_backup(model, f, chunk_size)
+                    else:
+                        with open(part, encoding='utf-8') as part_file:
+                            shutil.copyfileobj(part_file, f)
+                f.write('}')
+        finally:
+            for part in parts:
+                if part is not None:
+                    os.remove(part)
         
+        self._release_page_cache(backup_file)
         return backup_file
     
+    @staticmethod
+    def _release_page_cache(path: str) -> None:
+        """
+        Flush a finished backup to disk and drop it from the page cache
+        
+        Backups are written once and rarely read, so keeping them cached
+        would only evict data the running ETL is still using.
+        """
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fdatasync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    
+    @staticmethod
+    def _write_model_backup(model: Any, stream: Any, chunk_size: int) -> None:
+        """
+        Serialize every row of a model to a JSON array on the given stream
+        
+        Produces the same objects as Django's JSON serializer, but encodes each
+        chunk with jsonutils (orjson when installed); values JSON cannot encode
+        natively fall back to DjangoJSONEncoder.
+        """
+        # Serializers are only needed for backup and restore, so import lazily
+        from django.core.serializers import get_serializer
+        from django.core.serializers.json import DjangoJSONEncoder
+        
+        serializer = get_serializer('python')()
+        encode_default = DjangoJSONEncoder().default
+        rows = model.objects.all().iterator(chunk_size=chunk_size)
+        
+        stream.write('[')
+        separator = ''
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            stream.write(separator)
+            stream.write(', '.join(
+                jsonutils.dumps(obj, default=encode_default)
+                for obj in serializer.serialize(chunk)
+            ))
+            separator = ', '
+        stream.write(']')
+    
+    def _backup_models_in_parallel(
+        self, models: List[Any], chunk_size: int, max_workers: int
+    ) -> List[Optional[str]]:
+        """
+        Serialize models concurrently into temporary part files
+        
+        Returns the part file for each model, or None for every model when
+        the backup has to be written sequentially: with a single model or
+        worker, on SQLite, or inside a transaction. Other threads' connections
+        would not see uncommitted rows, nor the tables of an in-memory SQLite
+        database.
+        """
+        workers = min(len(models), max_workers)
+        model_connections = [
+            transaction.get_connection(router.db_for_read(model)) for model in models
+        ]
+        shared_only = any(
+            connection.vendor == "sqlite" or connection.in_atomic_block
+            for connection in model_connections
+        )
+        if workers <= 1 or shared_only:
+            return [None] * len(models)
+        
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._backup_model_to_part, model, chunk_size)
+                for model in models
+            ]
+        
+        parts = []
+        errors = []
+        for future in futures:
+            try:
+                parts.append(future.result())
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            for part in parts:
+                os.remove(part)
+            raise errors[0]
+        return parts
+    
+    def _backup_model_to_part(self, model: Any, chunk_size: int) -> str:
+        """Write one model's backup to a temporary file (runs in a worker thread)"""
+        part_file = tempfile.NamedTemporaryFile(
+            'w', encoding='utf-8', dir=self.backup_location,
+            suffix='.part', delete=False
+        )
+        try:
+            with part_file:
+                self._write_model_backup(model, part_file, chunk_size)
+            return part_file.name
+        except Exception:
+            os.remove(part_file.name)
+            raise
+        finally:
+            # Worker threads get their own connections; don't leak them
+            connections.close_all()
+    
+    @staticmethod
+    def _open_backup(backup_file: str, mode: str):
+        """Open a backup file as text, transparently handling gzip compression"""
+        if backup_file.endswith(".gz"):
+            return gzip.open(backup_file, mode + 't', encoding='utf-8')
+        return open(backup_file, mode, encoding='utf-8', buffering=BACKUP_BUFFER_SIZE)
+    
     def rollback_migration(self, migration_id: str, strategy: str = "restore_backup") -> bool:
         """Rollback a specific migration"""
         snapshot = self._find_snapshot(migration_id)
@@ -94,20 +246,77 @@ class ETLRollbackManager:
     
     def _restore_from_backup(self, snapshot: MigrationSnapshot) -> bool:
         """Restore data from backup file"""
+        from django.core.serializers import deserialize
+        
         if not snapshot.backup_location:
             raise ValueError("No backup location specified")
         
-        with open(snapshot.backup_location, 'r') as f:
-            backup_data = json.load(f)
+        with self._open_backup(snapshot.backup_location, 'r') as f:
+            backup_data = jsonutils.loads(f.read())
+        
+        batch_size = config_manager.get_transformation_config().batch_size
         
-        # Delete current data and restore from backup
         for model_name, serialized_objects in backup_data.items():
-            # This is a simplified version - in production, you'd need more sophisticated restoration
-            for obj_data in deserialize('json', json.dumps(serialized_objects)):
-                obj_data.save()
+            model = apps.get_model(model_name)
+            # The backup is already parsed; deserialize the dicts directly.
+            # Bind one iterator: newer Django restarts the Deserializer on
+            # every iter() call, so islice() would see the first batch forever
+            deserialized = iter(deserialize('python', serialized_objects))
+            # Restore a batch of rows at a time instead of one save() per row
+            while True:
+                batch = list(islice(deserialized, batch_size))
+                if not batch:
+                    break
+                self._restore_batch(model, batch)
         
         return True
     
+    @staticmethod
+    def _restore_batch(model: Any, batch: List[Any]) -> None:
+        """
+        Write a batch of deserialized objects back to their table
+        
+        Rows that still exist are updated and missing rows are re-created,
+        matching what DeserializedObject.save() does one row at a time.
+        """
+        if model._meta.parents:
+            # bulk_create() doesn't support multi-table inheritance
+            for deserialized in batch:
+                deserialized.save()
+            return
+        
+        manager = model._base_manager
+        objects = [deserialized.object for deserialized in batch]
+        existing = set(
+            manager.filter(pk__in=[obj.pk for obj in objects]).values_list('pk', flat=True)
+        )
+        
+        to_update = [obj for obj in objects if obj.pk in existing]
+        fields = [f.name for f in model._meta.concrete_fields if not f.primary_key]
+        # bulk_update() rejects an empty field list (a pk-only model)
+        if to_update and fields:
+            manager.bulk_update(to_update, fields)
+        
+        to_create = [obj for obj in objects if obj.pk not in existing]
+        if to_create:
+            # bulk_create stamps auto_now/auto_now_add fields, so put the
+            # backed-up values back afterwards
+            auto_fields = [
+                f for f in model._meta.concrete_fields
+                if getattr(f, 'auto_now', False) or getattr(f, 'auto_now_add', False)
+            ]
+            timestamps = [[getattr(obj, f.attname) for f in auto_fields] for obj in to_create]
+            manager.bulk_create(to_create)
+            if auto_fields:
+                for obj, values in zip(to_create, timestamps):
+                    for field, value in zip(auto_fields, values):
+                        setattr(obj, field.attname, value)
+                manager.bulk_update(to_create, [f.name for f in auto_fields])
+        
+        for deserialized in batch:
+            for accessor_name, object_list in (deserialized.m2m_data or {}).items():
+                getattr(deserialized.object, accessor_name).set(object_list)
+    
     def _delete_new_records(self, snapshot: MigrationSnapshot) -> bool:
         """Delete records created after snapshot"""
         # This would require timestamp tracking on models
@@ -116,10 +325,7 @@ class ETLRollbackManager:
     
     def _find_snapshot(self, migration_id: str) -> Optional[MigrationSnapshot]:
         """Find snapshot by migration ID"""
-        for snapshot in self.snapshots:
-            if snapshot.migration_id == migration_id:
-                return snapshot
-        return None
+        return self._snapshots_by_id.get(migration_id)
     
     def list_snapshots(self) -> List[Dict[str, Any]]:
         """List all available snapshots"""
@@ -156,14 +362,15 @@ class RecoveryManager:
     
     def create_recovery_point(self, name: str, description: str = "") -> str:
         """Create a recovery point"""
-        recovery_id = f"recovery_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        now = datetime.now()
+        recovery_id = f"recovery_{now.strftime('%Y%m%d_%H%M%S')}"
         
         # In production, this would create database snapshots, etc.
         recovery_point = {
             "id": recovery_id,
             "name": name,
             "description": description,
-            "timestamp": datetime.now(),
+            "timestamp": now,
             "database_state": self._capture_database_state()
         }
         
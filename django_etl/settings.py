@@ -6,6 +6,9 @@ These settings can be overridden in your Django project's settings.py by definin
 """
 
 from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from functools import lru_cache
 import os
 
 # Default ETL configuration
@@ -17,11 +20,13 @@ DEFAULT_ETL_CONFIG = {
         "BATCH_SIZE": 1000,
         "MAX_RETRIES": 3,
         "RETRY_DELAY": 5,
+        "MAX_RETRY_DELAY": 60,
         "ENABLE_VALIDATION": True,
         "VALIDATION_MODE": "strict",  # strict, lenient, warning_only
         "CLEANUP_ON_ERROR": True,
         "PARALLEL_PROCESSING": False,
         "MAX_WORKERS": 4,
+        "BULK_CREATE_BATCH_SIZE": None,  # None picks one per database backend
     },
     # Logging settings
     "LOGGING": {
@@ -40,6 +45,7 @@ DEFAULT_ETL_CONFIG = {
         "ALERT_EMAIL": None,
         "WEBHOOK_URL": None,
         "SLACK_CHANNEL": None,
+        "MAX_SAMPLES_PER_OP": 500,  # None keeps every profiler measurement
     },
     # Directory settings (will use BASE_DIR if available)
     "BACKUP_DIRECTORY": "/tmp/etl_backups",
@@ -49,25 +55,48 @@ DEFAULT_ETL_CONFIG = {
     "ENABLE_ROLLBACK": True,
     "ENABLE_DRY_RUN": True,
     "ENABLE_PARALLEL_TRANSFORMS": False,
+    # Also register the ETL models with Django's default admin site
+    "REGISTER_DEFAULT_ADMIN": True,
     # Transformer discovery
     "TRANSFORMER_DISCOVERY_PATHS": [],
     # Required databases (will validate these exist in Django DATABASES)
     "REQUIRED_DATABASES": ["default"],
 }
 
+# Sentinel for settings missing from both ETL_CONFIG and the defaults
+_MISSING = object()
+
 
 # Get user configuration from Django settings
 def get_etl_setting(name, default=None):
-    """Get ETL setting from Django settings with fallback to defaults"""
+    """
+    Get ETL setting from Django settings with fallback to defaults
+
+    Lookups are cached per name; the cache is cleared whenever ETL_CONFIG is
+    overridden (e.g. with override_settings), or via get_etl_setting.cache_clear().
+    """
+    value = _lookup_etl_setting(name)
+    return default if value is _MISSING else value
+
+
+@lru_cache(maxsize=None)
+def _lookup_etl_setting(name):
+    """Resolve a setting from ETL_CONFIG, then the defaults; _MISSING if neither has it"""
     etl_settings = getattr(settings, "ETL_CONFIG", {})
 
     if name in etl_settings:
         return etl_settings[name]
 
-    if name in DEFAULT_ETL_CONFIG:
-        return DEFAULT_ETL_CONFIG[name]
+    return DEFAULT_ETL_CONFIG.get(name, _MISSING)
+
+
+get_etl_setting.cache_clear = _lookup_etl_setting.cache_clear
+
 
-    return default
+@receiver(setting_changed)
+def _clear_etl_setting_cache(setting, **kwargs):
+    if setting == "ETL_CONFIG":
+        get_etl_setting.cache_clear()
 
 
 # Commonly used settings for backward compatibility
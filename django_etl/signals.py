@@ -0,0 +1,32 @@
+"""
+Django ETL Framework signal handlers
+Keeps cached admin statistics in step with migration log writes
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import MigrationLog, MigrationRunSummary
+
+# Cache keys for data derived from MigrationLog / MigrationRunSummary rows
+SUMMARY_STATS_CACHE_KEY = "etl:migration_log_stats"
+DASHBOARD_STATS_CACHE_KEY = "etl:dashboard_stats"
+TRANSFORMER_NAMES_CACHE_KEY = "etl:distinct_transformers"
+USER_NAMES_CACHE_KEY = "etl:distinct_users"
+
+ADMIN_CACHE_KEYS = [
+    SUMMARY_STATS_CACHE_KEY,
+    DASHBOARD_STATS_CACHE_KEY,
+    TRANSFORMER_NAMES_CACHE_KEY,
+    USER_NAMES_CACHE_KEY,
+]
+
+
+@receiver(post_save, sender=MigrationLog)
+@receiver(post_delete, sender=MigrationLog)
+@receiver(post_save, sender=MigrationRunSummary)
+@receiver(post_delete, sender=MigrationRunSummary)
+def invalidate_admin_caches(sender, **kwargs):
+    """Drop cached admin statistics after a migration log write"""
+    cache.delete_many(ADMIN_CACHE_KEYS)
@@ -9,16 +9,24 @@ import sys
 import django
 from pathlib import Path
 
-# Setup Django
 BASE_DIR = Path(__file__).resolve().parent.parent
-sys.path.append(str(BASE_DIR))
-os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.local")
-django.setup()
 
-from django.db import connections
+from django.db import DatabaseError, connections
 from .helpers import DataCleaner, HashGenerator
 import argparse
 import json
+from collections import deque
+from functools import lru_cache
+from itertools import chain
+
+# Django field types reported by introspection for text columns
+TEXT_FIELD_TYPES = {"CharField", "TextField"}
+
+# Largest duplicate groups returned by find_duplicates_in_table
+MAX_DUPLICATE_GROUPS = 10000
+
+# Rows fetched per round trip when reading larger result sets
+FETCH_CHUNK_SIZE = 1000
 
 
 class ETLUtils:
@@ -36,55 +44,57 @@ class ETLUtils:
         Returns:
             Dictionary with quality metrics
         """
-        with connections[database].cursor() as cursor:
-            # Get basic stats
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            total_rows = cursor.fetchone()[0]
-
-            # Get column info (database-agnostic)
-            columns = ETLUtils._get_table_columns(cursor, table_name, database)
-
-            quality_report = {
-                "table_name": table_name,
-                "total_rows": total_rows,
-                "columns": columns,
-                "quality_issues": {},
-            }
-
-            # Check for null values in each column
-            for column in columns:
-                cursor.execute(
-                    f"SELECT COUNT(*) FROM {table_name} WHERE {column} IS NULL"
-                )
-                null_count = cursor.fetchone()[0]
-
-                if null_count > 0:
-                    quality_report["quality_issues"][f"{column}_nulls"] = {
-                        "count": null_count,
-                        "percentage": round((null_count / total_rows) * 100, 2),
+        connection = connections[database]
+        quote_name = connection.ops.quote_name
+
+        # Get column info (database-agnostic)
+        columns = list(ETLUtils._get_table_columns(table_name, database))
+        text_columns = ETLUtils._get_text_columns(table_name, database)
+
+        with connection.cursor() as cursor:
+            # Count rows, NULLs and empty strings in a single scan of the table
+            empty_columns = [column for column in columns if column in text_columns]
+            aggregates = ["COUNT(*)"]
+            aggregates.extend(
+                f"SUM(CASE WHEN {quote_name(column)} IS NULL THEN 1 ELSE 0 END)"
+                for column in columns
+            )
+            aggregates.extend(
+                f"SUM(CASE WHEN {quote_name(column)} = '' THEN 1 ELSE 0 END)"
+                for column in empty_columns
+            )
+            cursor.execute(
+                f"SELECT {', '.join(aggregates)} FROM "
+                f"{ETLUtils._quote_table_name(connection, table_name)}"
+            )
+            row = cursor.fetchone()
+
+        total_rows = row[0]
+        quality_report = {
+            "table_name": table_name,
+            "total_rows": total_rows,
+            "columns": columns,
+            "quality_issues": {},
+        }
+
+        # SUM() over an empty table is NULL
+        null_counts = zip(columns, row[1 : len(columns) + 1])
+        empty_counts = zip(empty_columns, row[len(columns) + 1 :])
+
+        for suffix, counts in (("nulls", null_counts), ("empty", empty_counts)):
+            for column, count in counts:
+                if count:
+                    quality_report["quality_issues"][f"{column}_{suffix}"] = {
+                        "count": count,
+                        "percentage": round((count / total_rows) * 100, 2),
                     }
 
-            # Check for empty strings in text columns
-            for column in columns:
-                try:
-                    cursor.execute(
-                        f"SELECT COUNT(*) FROM {table_name} WHERE {column} = ''"
-                    )
-                    empty_count = cursor.fetchone()[0]
-
-                    if empty_count > 0:
-                        quality_report["quality_issues"][f"{column}_empty"] = {
-                            "count": empty_count,
-                            "percentage": round((empty_count / total_rows) * 100, 2),
-                        }
-                except:
-                    # Column might not be text type
-                    pass
-
-            return quality_report
+        return quality_report
 
     @staticmethod
-    def find_duplicates_in_table(table_name, columns, database="legacy"):
+    def find_duplicates_in_table(
+        table_name, columns, database="legacy", limit=MAX_DUPLICATE_GROUPS
+    ):
         """
         Find duplicate records in a table based on specific columns
 
@@ -92,6 +102,7 @@ class ETLUtils:
             table_name: Name of the table
             columns: List of column names to check for duplicates
             database: Database alias
+            limit: Maximum number of duplicate groups to return, largest first
 
         Returns:
             List of duplicate groups
@@ -105,15 +116,23 @@ class ETLUtils:
             GROUP BY {column_list}
             HAVING COUNT(*) > 1
             ORDER BY count DESC
+            LIMIT {int(limit)}
             """
 
             cursor.execute(sql)
-            duplicates = cursor.fetchall()
 
-            return [
-                {"values": dict(zip(columns, row[:-1])), "count": row[-1]}
-                for row in duplicates
-            ]
+            # Build the result from fetched chunks instead of a full fetchall() copy
+            duplicates = []
+            while True:
+                rows = cursor.fetchmany(FETCH_CHUNK_SIZE)
+                if not rows:
+                    break
+                duplicates.extend(
+                    {"values": dict(zip(columns, row[:-1])), "count": row[-1]}
+                    for row in rows
+                )
+
+            return duplicates
 
     @staticmethod
     def preview_transformation(table_name, columns, database="legacy", limit=10):
@@ -135,16 +154,14 @@ class ETLUtils:
 
             rows = cursor.fetchall()
             preview = []
+            clean = DataCleaner.clean_string
 
             for row in rows:
                 original = dict(zip(columns, row))
                 transformed = {}
 
-                for i, value in enumerate(row):
-                    column = columns[i]
-
-                    # Apply common transformations
-                    cleaned = DataCleaner.clean_string(value)
+                # Apply common transformations
+                for column, value, cleaned in zip(columns, row, map(clean, row)):
                     transformed[column] = {
                         "original": value,
                         "cleaned": cleaned,
@@ -157,7 +174,9 @@ class ETLUtils:
             return preview
 
     @staticmethod
-    def estimate_transformation_time(table_name, database="legacy", batch_size=1000):
+    def estimate_transformation_time(
+        table_name, database="legacy", batch_size=1000, total_rows=None
+    ):
         """
         Estimate how long a transformation will take
 
@@ -165,6 +184,7 @@ class ETLUtils:
             table_name: Source table name
             database: Database alias
             batch_size: Batch size for processing
+            total_rows: Row count if already known, to skip the COUNT query
 
         Returns:
             Time estimates
@@ -173,8 +193,9 @@ class ETLUtils:
 
         with connections[database].cursor() as cursor:
             # Get total count
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            total_rows = cursor.fetchone()[0]
+            if total_rows is None:
+                cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
+                total_rows = cursor.fetchone()[0]
 
             # Time a small batch
             start_time = time.time()
@@ -183,10 +204,9 @@ class ETLUtils:
             )
             sample_rows = cursor.fetchall()
 
-            # Simulate processing
-            for row in sample_rows:
-                for value in row:
-                    DataCleaner.clean_string(value)
+            # Simulate processing; map() keeps the per-value loop out of the
+            # interpreter so the timing reflects cleaning cost, not loop overhead
+            deque(map(DataCleaner.clean_string, chain.from_iterable(sample_rows)), maxlen=0)
 
             processing_time = time.time() - start_time
 
@@ -208,21 +228,67 @@ class ETLUtils:
             }
 
     @staticmethod
-    def _get_table_columns(cursor, table_name, database="legacy"):
+    def full_report(table_name, columns, database="legacy", limit=10, batch_size=1000):
+        """
+        Run analyze, duplicates, preview and estimate for one table
+
+        The row count from the quality scan is reused by the estimate, so the
+        table is fully scanned twice (quality and duplicates) instead of four
+        times across separate invocations.
+
+        Args:
+            table_name: Name of the table
+            columns: Columns to check for duplicates and to preview
+            database: Database alias
+            limit: Number of rows to preview
+            batch_size: Batch size for estimation
+
+        Returns:
+            Dictionary with one entry per report
+        """
+        quality = ETLUtils.analyze_table_quality(table_name, database)
+        return {
+            "analyze": quality,
+            "duplicates": ETLUtils.find_duplicates_in_table(
+                table_name, columns, database
+            ),
+            "preview": ETLUtils.preview_transformation(
+                table_name, columns, database, limit
+            ),
+            "estimate": ETLUtils.estimate_transformation_time(
+                table_name, database, batch_size, total_rows=quality["total_rows"]
+            ),
+        }
+
+    @staticmethod
+    def _quote_table_name(connection, table_name):
+        """Quote a table name, quoting each part of a schema-qualified name"""
+        quote_name = connection.ops.quote_name
+        return ".".join(quote_name(part) for part in table_name.split("."))
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_table_columns(table_name, database="legacy"):
         """
         Get column names from a table in a database-agnostic way
 
+        Results are cached per table and database; call
+        ETLUtils._get_table_columns.cache_clear() after a schema change.
+
         Args:
-            cursor: Database cursor
             table_name: Name of the table
             database: Database alias
 
         Returns:
-            List of column names
+            Tuple of column names
         """
         connection = connections[database]
-        vendor = connection.vendor
+        with connection.cursor() as cursor:
+            return tuple(ETLUtils._read_table_columns(cursor, table_name, connection.vendor))
 
+    @staticmethod
+    def _read_table_columns(cursor, table_name, vendor):
+        """Query the column names of a table for the given database vendor"""
         if vendor == "mysql":
             cursor.execute(f"DESCRIBE {table_name}")
             # MySQL DESCRIBE returns: Field, Type, Null, Key, Default, Extra
@@ -233,12 +299,13 @@ class ETLUtils:
             columns = [row[1] for row in cursor.fetchall()]
         elif vendor == "postgresql":
             cursor.execute(
-                f"""
+                """
                 SELECT column_name 
                 FROM information_schema.columns 
-                WHERE table_name = '{table_name}'
+                WHERE table_name = %s
                 ORDER BY ordinal_position
-            """
+            """,
+                [table_name],
             )
             columns = [row[0] for row in cursor.fetchall()]
         else:
@@ -253,11 +320,57 @@ class ETLUtils:
 
         return columns
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_text_columns(table_name, database="legacy"):
+        """
+        Get the names of a table's text columns, which can hold empty strings
+
+        Cached like _get_table_columns(). Introspection only knows unqualified
+        table names; when it can't describe the table (e.g. "schema.table"),
+        no columns are reported and the empty-string checks are skipped.
+
+        Args:
+            table_name: Name of the table
+            database: Database alias
+
+        Returns:
+            Frozenset of column names
+        """
+        introspection = connections[database].introspection
+        text_columns = set()
+
+        try:
+            with connections[database].cursor() as cursor:
+                description = introspection.get_table_description(cursor, table_name)
+        except DatabaseError:
+            return frozenset()
+
+        for info in description:
+            try:
+                field_type = introspection.get_field_type(info.type_code, info)
+            except KeyError:
+                # Type without a Django field equivalent
+                continue
+            if field_type in TEXT_FIELD_TYPES:
+                text_columns.add(info.name)
+
+        return frozenset(text_columns)
+
+
+def setup_django():
+    """Configure Django for standalone CLI use; importing ETLUtils doesn't need it"""
+    sys.path.append(str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings.local")
+    django.setup()
+
 
 def main():
+    setup_django()
+
     parser = argparse.ArgumentParser(description="ETL Utility Commands")
     parser.add_argument(
-        "command", choices=["analyze", "duplicates", "preview", "estimate"]
+        "command", choices=["analyze", "duplicates", "preview", "estimate", "all"]
     )
     parser.add_argument("--table", required=True, help="Table name to analyze")
     parser.add_argument("--columns", help="Comma-separated list of columns")
@@ -296,6 +409,15 @@ def main():
             args.table, args.database, args.batch_size
         )
 
+    elif args.command == "all":
+        if not args.columns:
+            print("Error: --columns required for all command")
+            sys.exit(1)
+        columns = [col.strip() for col in args.columns.split(",")]
+        result = ETLUtils.full_report(
+            args.table, columns, args.database, args.limit, args.batch_size
+        )
+
     # Output results
     if result:
         output_json = json.dumps(result, indent=2, default=str)
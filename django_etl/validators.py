@@ -4,10 +4,37 @@ Provides comprehensive data quality checks and validation rules
 """
 
 import re
+import string
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date
-from typing import Dict, List, Any, Callable, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Any, Callable, Optional, Tuple, Union, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+from .config import DATACLASS_SLOTS
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Patterns used by the validation rules, compiled once at import. They are
+# applied with match(), which already anchors at the start; \Z anchors the
+# end without $'s allowance for a trailing newline.
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\Z', re.ASCII)
+_PATIENT_ID_RE = re.compile(r'[A-Z0-9]{6,12}\Z')
+_MRN_SEPARATOR_RE = re.compile(r'[\-\s]')
+
+# Email addresses as matched by _EMAIL_RE, checked without the regex engine
+_EMAIL_LOCAL_CHARS = frozenset(string.ascii_letters + string.digits + '._%+-')
+_EMAIL_DOMAIN_CHARS = frozenset(string.ascii_letters + string.digits + '.-')
+
+# Phone numbers: ASCII digits and separators, after an optional leading "+"
+_PHONE_SEPARATORS = ' \t\n\r\f\v-()'
+_PHONE_CHARS = frozenset('0123456789' + _PHONE_SEPARATORS)
+_PHONE_SEPARATOR_DELETE = str.maketrans('', '', _PHONE_SEPARATORS)
+
+# Accepted values, in the form values are normalized to before the lookup
+_VALID_GENDERS = frozenset({'M', 'F', 'Male', 'Female', 'Other', 'U', 'Unknown'})
+_VALID_BLOOD_TYPES = frozenset({'A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-'})
 
 
 class ValidationSeverity(Enum):
@@ -16,7 +43,7 @@ class ValidationSeverity(Enum):
     INFO = "info"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ValidationResult:
     field: str
     value: Any
@@ -26,12 +53,25 @@ class ValidationResult:
     rule_name: str
 
 
+# Enum members are singletons; the validation loops compare them by identity
+# against these module constants instead of looking them up on the class
+_ERROR = ValidationSeverity.ERROR
+_WARNING = ValidationSeverity.WARNING
+
+# Keys of the parallel lists collected by validate_batch(collect='columns')
+RESULT_COLUMNS = ('field', 'value', 'severity', 'message', 'rule_name')
+
+
 class DataQualityValidator:
     """Advanced data quality validation framework"""
     
+    __slots__ = ('rules', 'results', '_compiled_rules')
+    
     def __init__(self):
         self.rules = []
         self.results = []
+        # Rules frozen into tuples for the validation loop; rebuilt after add_rule()
+        self._compiled_rules = None
     
     def add_rule(self, field: str, rule_func: Callable, severity: ValidationSeverity = ValidationSeverity.ERROR, message: str = "", name: str = ""):
         """Add a validation rule"""
@@ -42,27 +82,42 @@ class DataQualityValidator:
             'message': message,
             'name': name or rule_func.__name__
         })
+        self._compiled_rules = None
+    
+    def _compile_rules(self) -> tuple:
+        """Freeze the rules into (field, func, severity, message, name) tuples"""
+        if self._compiled_rules is None:
+            self._compiled_rules = tuple(
+                (
+                    rule['field'],
+                    rule['rule_func'],
+                    rule['severity'],
+                    rule['message'] or f"Validation failed for {rule['field']}",
+                    rule['name'],
+                )
+                for rule in self.rules
+            )
+        return self._compiled_rules
+    
+    def validate_record(self, record: Dict[str, Any], fast_fail: bool = False) -> List[ValidationResult]:
+        """
+        Validate a single record against all rules
+        
+        With fast_fail, stop at the first failed ERROR rule; the remaining
+        rules are not run and have no results.
+        """
+        return self._check_record(record, fast_fail)[0]
     
-    def validate_record(self, record: Dict[str, Any]) -> List[ValidationResult]:
-        """Validate a single record against all rules"""
+    def _check_record(self, record: Dict[str, Any], fast_fail: bool) -> Tuple[List[ValidationResult], bool, bool]:
+        """Validate a record; returns (results, has_errors, has_warnings)"""
         results = []
+        has_errors = has_warnings = False
         
-        for rule in self.rules:
-            field = rule['field']
+        for field, rule_func, severity, message, name in self._compile_rules():
             value = record.get(field)
             
             try:
-                is_valid = rule['rule_func'](value)
-                result = ValidationResult(
-                    field=field,
-                    value=value,
-                    is_valid=is_valid,
-                    severity=rule['severity'],
-                    message=rule['message'] or f"Validation failed for {field}",
-                    rule_name=rule['name']
-                )
-                results.append(result)
-                
+                is_valid = rule_func(value)
             except Exception as e:
                 result = ValidationResult(
                     field=field,
@@ -70,29 +125,82 @@ class DataQualityValidator:
                     is_valid=False,
                     severity=ValidationSeverity.ERROR,
                     message=f"Validation error: {str(e)}",
-                    rule_name=rule['name']
+                    rule_name=name
                 )
                 results.append(result)
+                has_errors = True
+                if fast_fail:
+                    break
+                continue
+            
+            result = ValidationResult(
+                field=field,
+                value=value,
+                is_valid=is_valid,
+                severity=severity,
+                message=message,
+                rule_name=name
+            )
+            results.append(result)
+            
+            if not is_valid:
+                if severity is _ERROR:
+                    has_errors = True
+                    if fast_fail:
+                        break
+                elif severity is _WARNING:
+                    has_warnings = True
         
-        return results
+        return results, has_errors, has_warnings
     
-    def validate_batch(self, records: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Validate a batch of records"""
-        all_results = []
+    def iter_validate_batch(
+        self, records: Iterable[Dict[str, Any]], fast_fail: bool = False
+    ) -> Iterator[Tuple[int, List[ValidationResult]]]:
+        """Validate records one at a time, yielding (index, results) for each"""
+        for index, record in enumerate(records):
+            yield index, self.validate_record(record, fast_fail=fast_fail)
+    
+    def validate_batch(
+        self,
+        records: Iterable[Dict[str, Any]],
+        fast_fail: bool = False,
+        collect: str = 'all'
+    ) -> Dict[str, Any]:
+        """
+        Validate a batch of records
+        
+        fast_fail stops checking a record at its first error (see
+        validate_record); the counts are unchanged, but 'validation_results'
+        omits the rules skipped for failing records.
+        
+        collect chooses what 'validation_results' holds: every result
+        ('all'), only failed checks ('failures') or nothing ('none'). Large
+        batches only need to keep what is collected in memory. 'columns'
+        holds the failed checks as a dict of parallel lists keyed by
+        RESULT_COLUMNS, with severities as their string values; it can be
+        passed straight to pyarrow.table() or pandas.DataFrame().
+        """
+        if collect not in ('all', 'failures', 'none', 'columns'):
+            raise ValueError(f"Unknown collect mode: {collect}")
+        
+        all_results = _new_result_columns() if collect == 'columns' else []
         summary = {
-            'total_records': len(records),
+            'total_records': 0,
             'valid_records': 0,
             'records_with_errors': 0,
             'records_with_warnings': 0,
             'validation_results': []
         }
         
-        for i, record in enumerate(records):
-            record_results = self.validate_record(record)
-            all_results.extend(record_results)
-            
-            has_errors = any(r.severity == ValidationSeverity.ERROR and not r.is_valid for r in record_results)
-            has_warnings = any(r.severity == ValidationSeverity.WARNING and not r.is_valid for r in record_results)
+        for record in records:
+            record_results, has_errors, has_warnings = self._check_record(record, fast_fail)
+            summary['total_records'] += 1
+            if collect == 'all':
+                all_results.extend(record_results)
+            elif collect == 'failures':
+                all_results.extend(r for r in record_results if not r.is_valid)
+            elif collect == 'columns':
+                _append_failure_columns(all_results, record_results)
             
             if has_errors:
                 summary['records_with_errors'] += 1
@@ -103,6 +211,232 @@ class DataQualityValidator:
         
         summary['validation_results'] = all_results
         return summary
+    
+    def validate_batch_parallel(
+        self,
+        records: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        chunk_size: int = 10000,
+        fast_fail: bool = False,
+        collect: str = 'all'
+    ) -> Dict[str, Any]:
+        """
+        Validate a batch of records in chunks across worker processes
+        
+        The validator is pickled to each worker, so every rule must be
+        picklable: module-level functions and CommonValidationRules /
+        HealthcareValidationRules static rules work, but lambdas and the
+        rules built by the factory methods (numeric_range, regex_pattern, ...)
+        do not.
+        
+        Args:
+            records: List of record dictionaries
+            max_workers: Number of worker processes (default: CPU count)
+            chunk_size: Records validated per task
+            fast_fail: Passed through to validate_batch
+            collect: Passed through to validate_batch
+        
+        Returns:
+            The same summary as validate_batch
+        """
+        if len(records) <= chunk_size or max_workers == 1:
+            return self.validate_batch(records, fast_fail=fast_fail, collect=collect)
+        
+        chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            chunk_summaries = list(
+                pool.map(
+                    self.validate_batch,
+                    chunks,
+                    [fast_fail] * len(chunks),
+                    [collect] * len(chunks)
+                )
+            )
+        
+        summary = {
+            'total_records': 0,
+            'valid_records': 0,
+            'records_with_errors': 0,
+            'records_with_warnings': 0,
+            'validation_results': _new_result_columns() if collect == 'columns' else []
+        }
+        results = summary['validation_results']
+        for chunk_summary in chunk_summaries:
+            for key in ('total_records', 'valid_records', 'records_with_errors', 'records_with_warnings'):
+                summary[key] += chunk_summary[key]
+            if collect == 'columns':
+                for name, column in results.items():
+                    column.extend(chunk_summary['validation_results'][name])
+            else:
+                results.extend(chunk_summary['validation_results'])
+        return summary
+    
+    def validate_batch_vectorized(
+        self, records: List[Dict[str, Any]], collect_failures: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate a batch of records column by column with pandas
+        
+        Rules with a ``vectorized`` attribute (the null, email, range, length,
+        regex and choices rules from CommonValidationRules) check a whole
+        column in one call and return a bool Series; other rules are applied value by value. The
+        null, empty-string, email, patient ID and regex rules treat NaN as
+        null, where validate_batch would check it like any other value;
+        otherwise the counts match validate_batch.
+        
+        Args:
+            records: List of record dictionaries
+            collect_failures: Include a ValidationResult for every failed check
+        
+        Returns:
+            Summary with the same counts as validate_batch, apart from NaN as
+            noted above. 'validation_results' holds only the failures, and
+            only when collect_failures is set.
+        """
+        fields = {rule[0] for rule in self._compile_rules()}
+        columns = {
+            field: [record.get(field) for record in records] for field in fields
+        }
+        return self.validate_batch_columnar(columns, len(records), collect_failures)
+    
+    def validate_batch_columnar(
+        self,
+        columns: Dict[str, Any],
+        count: int,
+        collect_failures: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Validate data that is already laid out column by column
+        
+        Skips building one dict per record. Rows fetched from a DB cursor can
+        be passed as ``dict(zip(field_names, zip(*rows)))``. Works like
+        validate_batch_vectorized and requires pandas.
+        
+        Args:
+            columns: Field name -> sequence of values (list, tuple, array or
+                Series), each with one value per record; fields without a
+                column are treated as missing (None) in every record
+            count: Number of records
+            collect_failures: Include a ValidationResult for every failed check
+        
+        Returns:
+            The same summary as validate_batch_vectorized
+        """
+        import numpy as np
+        import pandas as pd
+        
+        has_errors = np.zeros(count, dtype=bool)
+        has_warnings = np.zeros(count, dtype=bool)
+        failures = []
+        series = {}
+        
+        for rule_index, (field, rule_func, severity, message, name) in enumerate(self._compile_rules()):
+            values = series.get(field)
+            if values is None:
+                column = columns.get(field)
+                if column is None:
+                    column = [None] * count
+                values = series[field] = pd.Series(list(column), dtype=object)
+            
+            vectorized = getattr(rule_func, 'vectorized', None)
+            if vectorized is not None:
+                outcomes = None
+                valid = vectorized(values).to_numpy(dtype=bool)
+                raised = np.zeros(count, dtype=bool)
+            else:
+                outcomes = values.map(lambda value: _apply_rule(rule_func, value))
+                valid = outcomes.map(lambda outcome: outcome is True).to_numpy(dtype=bool)
+                raised = outcomes.map(
+                    lambda outcome: isinstance(outcome, Exception)
+                ).to_numpy(dtype=bool)
+            
+            failed = ~valid
+            has_errors |= raised
+            if severity is _ERROR:
+                has_errors |= failed
+            elif severity is _WARNING:
+                has_warnings |= failed & ~raised
+            
+            if collect_failures:
+                for index in np.flatnonzero(failed):
+                    if raised[index]:
+                        result = ValidationResult(
+                            field=field,
+                            value=values.iat[index],
+                            is_valid=False,
+                            severity=ValidationSeverity.ERROR,
+                            message=f"Validation error: {str(outcomes.iat[index])}",
+                            rule_name=name
+                        )
+                    else:
+                        result = ValidationResult(
+                            field=field,
+                            value=values.iat[index],
+                            is_valid=False,
+                            severity=severity,
+                            message=message,
+                            rule_name=name
+                        )
+                    failures.append((index, rule_index, result))
+        
+        records_with_errors = int(has_errors.sum())
+        records_with_warnings = int((has_warnings & ~has_errors).sum())
+        failures.sort(key=lambda failure: failure[:2])
+        
+        return {
+            'total_records': count,
+            'valid_records': count - records_with_errors - records_with_warnings,
+            'records_with_errors': records_with_errors,
+            'records_with_warnings': records_with_warnings,
+            'validation_results': [result for _, _, result in failures]
+        }
+
+
+def _is_email(value: str) -> bool:
+    """Whether the value matches _EMAIL_RE, using character-set checks"""
+    local, at, domain = value.partition('@')
+    if not local or not at:
+        return False
+    # The top-level domain follows the last dot: two or more ASCII letters
+    dot = domain.rfind('.')
+    if dot < 1:
+        return False
+    tld = domain[dot + 1:]
+    return (
+        len(tld) >= 2 and tld.isascii() and tld.isalpha()
+        and _EMAIL_LOCAL_CHARS.issuperset(local)
+        and _EMAIL_DOMAIN_CHARS.issuperset(domain)
+    )
+
+
+def _apply_rule(rule_func: Callable, value: Any) -> Union[bool, Exception]:
+    """Run a rule on one value; returns the exception instead of raising it"""
+    try:
+        return bool(rule_func(value))
+    except Exception as e:
+        return e
+
+
+def _new_result_columns() -> Dict[str, list]:
+    """Empty parallel lists for a 'columns' result collection"""
+    return {name: [] for name in RESULT_COLUMNS}
+
+
+def _append_failure_columns(columns: Dict[str, list], results: Iterable[ValidationResult]) -> None:
+    """Append the failed results to the parallel lists of a 'columns' collection"""
+    for result in results:
+        if not result.is_valid:
+            columns['field'].append(result.field)
+            columns['value'].append(result.value)
+            columns['severity'].append(result.severity.value)
+            columns['message'].append(result.message)
+            columns['rule_name'].append(result.rule_name)
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str, flags: int = 0) -> "re.Pattern":
+    """Compile a regex once for every validator that uses the same pattern"""
+    return re.compile(pattern, flags)
 
 
 class CommonValidationRules:
@@ -123,8 +457,7 @@ class CommonValidationRules:
         """Validate email format"""
         if not value:
             return False
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, str(value)) is not None
+        return _is_email(str(value))
     
     @staticmethod
     def phone_format(value) -> bool:
@@ -132,16 +465,28 @@ class CommonValidationRules:
         if not value:
             return False
         # Simple phone validation - can be enhanced
-        pattern = r'^\+?[\d\s\-\(\)]+$'
-        return re.match(pattern, str(value)) is not None and len(re.sub(r'\D', '', str(value))) >= 10
+        value = str(value)
+        body = value[1:] if value.startswith('+') else value
+        if not body or not _PHONE_CHARS.issuperset(body):
+            return False
+        # Only digits remain once the separators are deleted
+        return len(body.translate(_PHONE_SEPARATOR_DELETE)) >= 10
     
     @staticmethod
     def date_format(value, date_format: str = "%Y-%m-%d") -> bool:
         """Validate date format"""
         if not value:
             return False
+        value = str(value)
+        # ISO dates are the common case and parse in C
+        if date_format == "%Y-%m-%d" and len(value) == 10 and value[4] == "-" and value[7] == "-":
+            try:
+                date.fromisoformat(value)
+                return True
+            except ValueError:
+                pass
         try:
-            datetime.strptime(str(value), date_format)
+            datetime.strptime(value, date_format)
             return True
         except ValueError:
             return False
@@ -149,51 +494,150 @@ class CommonValidationRules:
     @staticmethod
     def numeric_range(min_val: float = None, max_val: float = None):
         """Create a numeric range validator"""
-        def validator(value) -> bool:
-            if value is None:
-                return False
-            try:
-                num_val = float(value)
-                if min_val is not None and num_val < min_val:
+        # One specialization per combination of bounds, so unset bounds cost
+        # nothing per call; bounds are bound as defaults for fast local lookup
+        if min_val is not None and max_val is not None:
+            def validator(value, _min=min_val, _max=max_val) -> bool:
+                if value is None:
                     return False
-                if max_val is not None and num_val > max_val:
+                try:
+                    num_val = float(value)
+                    # Negated comparisons, so NaN passes as it always has
+                    return not (num_val < _min or num_val > _max)
+                except (ValueError, TypeError):
                     return False
-                return True
-            except (ValueError, TypeError):
-                return False
+        elif min_val is not None:
+            def validator(value, _min=min_val) -> bool:
+                if value is None:
+                    return False
+                try:
+                    return not float(value) < _min
+                except (ValueError, TypeError):
+                    return False
+        elif max_val is not None:
+            def validator(value, _max=max_val) -> bool:
+                if value is None:
+                    return False
+                try:
+                    return not float(value) > _max
+                except (ValueError, TypeError):
+                    return False
+        else:
+            def validator(value) -> bool:
+                if value is None:
+                    return False
+                try:
+                    float(value)
+                    return True
+                except (ValueError, TypeError):
+                    return False
+        
+        def vectorized(values: "pd.Series") -> "pd.Series":
+            import numpy as np
+            import pandas as pd
+            # Plain float array, so comparisons stay bool even when
+            # to_numeric() returns a nullable dtype; NaN compares False
+            numbers = pd.to_numeric(values, errors='coerce').to_numpy(
+                dtype=float, na_value=np.nan
+            )
+            valid = ~np.isnan(numbers)
+            if min_val is not None:
+                valid &= numbers >= min_val
+            if max_val is not None:
+                valid &= numbers <= max_val
+            # float() accepts more than to_numeric() (NaN, 'nan', '1_000'),
+            # so recheck the rejected values with the scalar rule
+            rejected = ~valid
+            if rejected.any():
+                valid[rejected] = values[rejected].map(validator).to_numpy(dtype=bool)
+            return pd.Series(valid, index=values.index)
+        
+        validator.vectorized = vectorized
         return validator
     
     @staticmethod
     def string_length(min_len: int = None, max_len: int = None):
         """Create a string length validator"""
-        def validator(value) -> bool:
-            if value is None:
-                return False
-            str_val = str(value)
-            if min_len is not None and len(str_val) < min_len:
-                return False
-            if max_len is not None and len(str_val) > max_len:
-                return False
-            return True
+        # Specialized like numeric_range()
+        if min_len is not None and max_len is not None:
+            def validator(value, _min=min_len, _max=max_len) -> bool:
+                return value is not None and _min <= len(str(value)) <= _max
+        elif min_len is not None:
+            def validator(value, _min=min_len) -> bool:
+                return value is not None and len(str(value)) >= _min
+        elif max_len is not None:
+            def validator(value, _max=max_len) -> bool:
+                return value is not None and len(str(value)) <= _max
+        else:
+            def validator(value) -> bool:
+                return value is not None
+        
+        def vectorized(values: "pd.Series") -> "pd.Series":
+            # str() per value rather than astype(str), which decodes bytes;
+            # only None is missing, as in the scalar rule (NaN is 'nan')
+            lengths = values.map(str).str.len()
+            valid = values.map(lambda value: value is not None).astype(bool)
+            if min_len is not None:
+                valid &= lengths >= min_len
+            if max_len is not None:
+                valid &= lengths <= max_len
+            return valid
+        
+        validator.vectorized = vectorized
         return validator
     
     @staticmethod
-    def regex_pattern(pattern: str):
+    def regex_pattern(pattern: str, flags: int = 0):
         """Create a regex pattern validator"""
+        compiled = _compile_pattern(pattern, flags)
+        
         def validator(value) -> bool:
             if value is None:
                 return False
-            return re.match(pattern, str(value)) is not None
+            return compiled.match(str(value)) is not None
+        
+        validator.vectorized = lambda values: _match_column(values, compiled)
         return validator
     
     @staticmethod
     def choices_validator(valid_choices: List[Any]):
         """Create a choices validator"""
+        try:
+            choices = frozenset(valid_choices)
+        except TypeError:
+            # Unhashable choices; fall back to scanning the list
+            choices = valid_choices
+        
         def validator(value) -> bool:
-            return value in valid_choices
+            try:
+                return value in choices
+            except TypeError:
+                # Unhashable value; compare against each choice instead
+                return value in valid_choices
+        
+        validator.vectorized = lambda values: values.isin(list(valid_choices))
         return validator
 
 
+def _match_column(values: "pd.Series", pattern: "re.Pattern") -> "pd.Series":
+    """Whether each non-null value, as a string, matches the pattern"""
+    # Matched value by value: newer pandas rejects compiled patterns with
+    # flags (such as re.ASCII) in Series.str.match(). Only present values are
+    # stringified; astype(str) can leave missing values as NaN.
+    match = pattern.match
+    valid = values.notna()
+    valid[valid] = values[valid].map(lambda value: match(str(value)) is not None).astype(bool)
+    return valid
+
+
+# Column-at-a-time equivalents used by DataQualityValidator.validate_batch_vectorized
+CommonValidationRules.not_null.vectorized = lambda values: values.notna()
+CommonValidationRules.not_empty_string.vectorized = lambda values: (
+    values.notna() & values.astype(str).str.strip().ne("")
+).astype(bool)
+CommonValidationRules.email_format.vectorized = lambda values: _match_column(values, _EMAIL_RE)
+
+
 class HealthcareValidationRules(CommonValidationRules):
     """Healthcare-specific validation rules"""
     
@@ -202,8 +646,7 @@ class HealthcareValidationRules(CommonValidationRules):
         """Validate patient ID format (alphanumeric, specific length)"""
         if not value:
             return False
-        pattern = r'^[A-Z0-9]{6,12}$'
-        return re.match(pattern, str(value)) is not None
+        return _PATIENT_ID_RE.match(str(value)) is not None
     
     @staticmethod
     def medical_record_number(value) -> bool:
@@ -211,7 +654,7 @@ class HealthcareValidationRules(CommonValidationRules):
         if not value:
             return False
         # Remove any separators and check if numeric
-        clean_value = re.sub(r'[\-\s]', '', str(value))
+        clean_value = _MRN_SEPARATOR_RE.sub('', str(value))
         return clean_value.isdigit() and len(clean_value) >= 6
     
     @staticmethod
@@ -230,13 +673,15 @@ class HealthcareValidationRules(CommonValidationRules):
         """Validate gender format"""
         if not value:
             return False
-        valid_genders = ['M', 'F', 'Male', 'Female', 'Other', 'U', 'Unknown']
-        return str(value).strip().title() in [g.title() for g in valid_genders]
+        return str(value).strip().title() in _VALID_GENDERS
     
     @staticmethod
     def blood_type_format(value) -> bool:
         """Validate blood type format"""
         if not value:
             return True  # Optional field
-        valid_types = ['A+', 'A-', 'B+', 'B-', 'AB+', 'AB-', 'O+', 'O-']
-        return str(value).upper().strip() in valid_types
+        return str(value).upper().strip() in _VALID_BLOOD_TYPES
+
+
+# Column-at-a-time equivalent used by DataQualityValidator.validate_batch_vectorized
+HealthcareValidationRules.patient_id_format.vectorized = lambda values: _match_column(values, _PATIENT_ID_RE)
@@ -81,6 +81,10 @@ setup(
             "prometheus-client>=0.14.0",
             "grafana-api>=1.0.0",
         ],
+        "performance": [
+            "orjson>=3.6.0",  # Faster JSON encoding
+            "xxhash>=3.0.0",  # Faster duplicate detection hashing
+        ],
         "async": [
             "aiofiles>=0.8.0",
             "asyncpg>=0.25.0",  # Async PostgreSQL
@@ -0,0 +1,18 @@
+"""
+Test suite for the Django ETL Framework
+
+Run with ``pytest`` or ``python -m unittest discover -s tests -t .``
+"""
+
+import django
+from django.conf import settings
+
+if not settings.configured:
+    settings.configure(
+        INSTALLED_APPS=["django_etl"],
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}
+        },
+        USE_TZ=True,
+    )
+    django.setup()
@@ -0,0 +1,34 @@
+"""Tests for BaseTransformer.safe_run"""
+
+import unittest
+
+from django.db import connection, transaction
+
+from django_etl.base import BaseTransformer
+
+
+class InTransactionTransformer(BaseTransformer):
+    """Reports whether run() was called inside a transaction"""
+
+    def run(self):
+        return connection.in_atomic_block
+
+
+class NonAtomicTransformer(InTransactionTransformer):
+    atomic_run = False
+
+
+class SafeRunTransactionTests(unittest.TestCase):
+    def test_runs_in_transaction_by_default(self):
+        self.assertTrue(InTransactionTransformer().safe_run(enable_rollback=False))
+
+    def test_atomic_run_false_runs_outside_transaction(self):
+        self.assertFalse(NonAtomicTransformer().safe_run(enable_rollback=False))
+
+    def test_atomic_run_false_keeps_savepoint_in_outer_transaction(self):
+        with transaction.atomic():
+            self.assertTrue(NonAtomicTransformer().safe_run(enable_rollback=False))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Tests for the management commands"""
+
+import io
+import logging
+import os
+import tempfile
+import unittest
+
+from django.core.management import call_command
+
+
+class MigrateLegacyDataLoggingTests(unittest.TestCase):
+    def test_keeps_host_handlers_and_removes_its_own(self):
+        root_logger = logging.getLogger()
+        host_handler = logging.StreamHandler(io.StringIO())
+        root_logger.addHandler(host_handler)
+        self.addCleanup(root_logger.removeHandler, host_handler)
+        handlers_before = list(root_logger.handlers)
+
+        with tempfile.TemporaryDirectory() as directory:
+            log_file = os.path.join(directory, "migration.log")
+            call_command(
+                "migrate_legacy_data",
+                "--dry-run",
+                "--log-file", log_file,
+                "--transformer-paths", "tests.no_such_module",
+                stdout=io.StringIO(),
+                stderr=io.StringIO(),
+            )
+
+            with open(log_file) as f:
+                self.assertIn("No transformers discovered", f.read())
+
+        self.assertEqual(root_logger.handlers, handlers_before)
+        self.assertIn("Starting enhanced ETL migration", host_handler.stream.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+"""Tests for the DataCleaner batch variants"""
+
+import unittest
+import warnings
+
+import pandas as pd
+
+from django_etl.helpers import DataCleaner
+
+# None, NaN and empty or blank strings alongside ordinary values
+VALUES = [
+    None,
+    float("nan"),
+    "",
+    "   ",
+    "  Jane   Doe ",
+    "555.123.4567",
+    "1 (555) 123-4567",
+    "12",
+    " John@Example.COM ",
+    "not-an-email@",
+    0,
+]
+
+
+class SeriesCleanerTests(unittest.TestCase):
+    """The *_series cleaners give the scalar cleaners' result per value"""
+
+    def assert_matches_scalar(self, series_cleaner, scalar_cleaner, values):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            cleaned = list(series_cleaner(pd.Series(values, dtype=object)))
+
+        expected = [scalar_cleaner(value) for value in values]
+        self.assertEqual(cleaned, expected)
+        # None stays None instead of turning into NaN
+        self.assertEqual(
+            [value is None for value in cleaned],
+            [value is None for value in expected],
+        )
+
+    def test_clean_string_series(self):
+        self.assert_matches_scalar(
+            DataCleaner.clean_string_series, DataCleaner.clean_string, VALUES
+        )
+
+    def test_clean_phone_series(self):
+        self.assert_matches_scalar(
+            DataCleaner.clean_phone_series, DataCleaner.clean_phone, VALUES
+        )
+
+    def test_clean_email_series(self):
+        self.assert_matches_scalar(
+            DataCleaner.clean_email_series, DataCleaner.clean_email, VALUES
+        )
+
+    def test_missing_values_in_string_series(self):
+        values = pd.Series(["a@b.co", None, ""])
+
+        self.assertEqual(list(DataCleaner.clean_string_series(values)), ["a@b.co", "", ""])
+        self.assertEqual(list(DataCleaner.clean_email_series(values)), ["a@b.co", None, None])
+        self.assertEqual(list(DataCleaner.clean_phone_series(values)), [None, None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()
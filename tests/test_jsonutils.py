@@ -0,0 +1,44 @@
+"""Tests for the JSON helpers"""
+
+import unittest
+import uuid
+from datetime import date, datetime, time, timezone
+from decimal import Decimal
+from unittest import mock
+
+from django_etl import jsonutils
+
+VALUE = {
+    "naive": datetime(2024, 1, 2, 3, 4, 5, 6),
+    "aware": datetime(2024, 1, 2, tzinfo=timezone.utc),
+    "date": date(2024, 1, 2),
+    "time": time(1, 2),
+    "uuid": uuid.UUID(int=5),
+    "text": "Zoë",
+    "amount": Decimal("1.50"),
+    "items": [1, 2.5, None, True],
+}
+
+
+class DumpsTests(unittest.TestCase):
+    def dumps_stdlib(self, *args, **kwargs):
+        with mock.patch.object(jsonutils, "orjson", None):
+            return jsonutils.dumps(*args, **kwargs)
+
+    def test_stdlib_fallback_writes_iso_dates(self):
+        encoded = self.dumps_stdlib({"at": datetime(2024, 1, 2, 3, 4, 5)}, default=str)
+
+        self.assertEqual(encoded, '{"at":"2024-01-02T03:04:05"}')
+
+    @unittest.skipIf(jsonutils.orjson is None, "orjson is not installed")
+    def test_stdlib_fallback_matches_orjson(self):
+        for indent in (False, True):
+            with self.subTest(indent=indent):
+                self.assertEqual(
+                    self.dumps_stdlib(VALUE, indent=indent, default=str),
+                    jsonutils.dumps(VALUE, indent=indent, default=str),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+"""Tests for ETLProfiler sampling"""
+
+import unittest
+
+from django_etl.profiler import ETLProfiler
+
+
+class ProfilerSampleLimitTests(unittest.TestCase):
+    def profile(self, profiler, times=10):
+        for _ in range(times):
+            with profiler.profile_operation("step"):
+                pass
+        return len(profiler.metrics["step"]["duration"])
+
+    def test_default_reads_config(self):
+        self.assertEqual(ETLProfiler().max_samples, 500)
+
+    def test_none_and_zero_keep_every_sample(self):
+        self.assertEqual(self.profile(ETLProfiler(None)), 10)
+        self.assertEqual(self.profile(ETLProfiler(0)), 10)
+
+    def test_limit_keeps_a_sample_and_exact_totals(self):
+        profiler = ETLProfiler(3)
+
+        self.assertEqual(self.profile(profiler), 3)
+        self.assertEqual(profiler.get_performance_report()["operations"]["step"]["count"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""Tests for the column-at-a-time validation rules"""
+
+import unittest
+import warnings
+
+from django_etl.validators import (
+    CommonValidationRules,
+    DataQualityValidator,
+    HealthcareValidationRules,
+)
+
+
+class VectorizedPatternRuleTests(unittest.TestCase):
+    """Pattern rules on columns with missing values"""
+
+    def assert_matches_scalar(self, validator, records):
+        vectorized = validator.validate_batch_vectorized(records)
+        scalar = validator.validate_batch(records)
+        for key in ("total_records", "valid_records", "records_with_errors"):
+            self.assertEqual(vectorized[key], scalar[key], key)
+
+    def test_email_column_with_none(self):
+        validator = DataQualityValidator()
+        validator.add_rule("email", CommonValidationRules.email_format)
+        records = [{"email": "a@example.com"}, {"email": None}, {"email": "bad"}]
+
+        summary = validator.validate_batch_vectorized(records)
+
+        self.assertEqual(summary["valid_records"], 1)
+        self.assertEqual(summary["records_with_errors"], 2)
+        self.assert_matches_scalar(validator, records)
+
+    def test_regex_column_with_none_and_nan(self):
+        validator = DataQualityValidator()
+        validator.add_rule("code", CommonValidationRules.regex_pattern(r"[A-Z]{3}\Z"))
+        records = [{"code": "ABC"}, {"code": None}, {"code": float("nan")}]
+
+        summary = validator.validate_batch_vectorized(records, collect_failures=True)
+
+        self.assertEqual(summary["valid_records"], 1)
+        self.assertEqual(summary["records_with_errors"], 2)
+
+    def test_patient_id_column_with_none(self):
+        validator = DataQualityValidator()
+        validator.add_rule("patient_id", HealthcareValidationRules.patient_id_format)
+        records = [{"patient_id": "ABC123"}, {"patient_id": None}, {}]
+
+        summary = validator.validate_batch_vectorized(records)
+
+        self.assertEqual(summary["valid_records"], 1)
+        self.assert_matches_scalar(validator, records)
+
+
+
+class VectorizedRangeAndLengthRuleTests(unittest.TestCase):
+    """Range and length rules give the scalar results without warnings"""
+
+    def test_matches_scalar_rules(self):
+        validator = DataQualityValidator()
+        validator.add_rule("amount", CommonValidationRules.numeric_range(0, 10))
+        validator.add_rule("minimum", CommonValidationRules.numeric_range(min_val=1))
+        validator.add_rule("code", CommonValidationRules.string_length(1, 3))
+        records = [
+            {"amount": 5, "minimum": 3, "code": "ab"},
+            {"amount": "nan", "minimum": "1_000", "code": b"x"},
+            {"amount": float("nan"), "minimum": 0, "code": None},
+            {"amount": "x", "minimum": None, "code": "abcd"},
+        ]
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            vectorized = validator.validate_batch_vectorized(
+                records, collect_failures=True
+            )
+        scalar = validator.validate_batch(records, collect="failures")
+
+        self.assertEqual(vectorized["valid_records"], scalar["valid_records"])
+        self.assertEqual(
+            vectorized["records_with_errors"], scalar["records_with_errors"]
+        )
+        self.assertEqual(
+            sorted((r.field, str(r.value)) for r in vectorized["validation_results"]),
+            sorted((r.field, str(r.value)) for r in scalar["validation_results"]),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()